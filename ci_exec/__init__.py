@@ -21,20 +21,29 @@ Quick Reference:
 .. coresummary::
 """
 
-# Import the core utilities in the ci_exec "namespace" for simpler imports.
+import importlib as _importlib
+import os as _os
+import sys as _sys
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+# NOTE: `colorize` is both a submodule and a function exported here.  Importing any
+# submodule that depends on it (e.g., core) binds ci_exec.colorize to the *module*,
+# which would then shadow a lazily resolved function.  It is cheap, import it eagerly.
 from .colorize import Ansi, Colors, Styles, colorize, log_stage
-from .core import Executable, fail, mkdir_p, rm_rf, which
-from .parsers import CMakeParser
-from .patch import filter_file, unified_diff
-from .provider import Provider
-from .utils import cd, merge_kwargs, set_env, unset_env
+
+if _TYPE_CHECKING:  # pragma: no cover
+    from .core import Executable, fail, mkdir_p, pipeline, rm_rf, which, which_many
+    from .parsers import CMakeParser
+    from .patch import filter_file, unified_diff
+    from .provider import Provider
+    from .utils import cd, merge_kwargs, set_env, unset_env
 
 __version__ = "0.1.3.dev"
 __all__ = [
     # Core imports from ci_exec.colorize module.
     "Ansi", "Colors", "Styles", "colorize", "log_stage",
     # Core imports from ci_exec.core module.
-    "Executable", "fail", "mkdir_p", "rm_rf", "which",
+    "Executable", "fail", "mkdir_p", "pipeline", "rm_rf", "which", "which_many",
     # Core imports from ci_exec.parsers package.
     "CMakeParser",
     # Core imports from ci_exec.patch module.
@@ -44,3 +53,42 @@ __all__ = [
     # Core imports from ci_exec.utils module.
     "cd", "merge_kwargs", "set_env", "unset_env"
 ]
+
+# Mapping of top-level names to the submodule they are (lazily) imported from.
+_lazy_imports = {
+    "Executable": ".core", "fail": ".core", "mkdir_p": ".core", "pipeline": ".core",
+    "rm_rf": ".core", "which": ".core", "which_many": ".core",
+    "CMakeParser": ".parsers",
+    "filter_file": ".patch", "unified_diff": ".patch",
+    "Provider": ".provider",
+    "cd": ".utils", "merge_kwargs": ".utils", "set_env": ".utils", "unset_env": ".utils"
+}
+
+# Submodules that are no longer imported eagerly, but ci_exec.core etc must still work.
+_lazy_submodules = ("core", "parsers", "patch", "provider", "utils")
+
+
+def __getattr__(name: str):
+    """Import top-level names from their submodule on first access (PEP 562)."""
+    if name in _lazy_submodules:
+        # Importing a submodule also binds it as an attribute of this package.
+        return _importlib.import_module(f".{name}", __name__)
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    val = getattr(_importlib.import_module(module_name, __name__), name)
+    globals()[name] = val
+    return val
+
+
+def __dir__():
+    """Include the lazily imported names and submodules in ``dir(ci_exec)``."""
+    return sorted(set(globals()) | set(__all__) | set(_lazy_submodules))
+
+
+# Module level __getattr__ requires python 3.7+.  Setting CI_EXEC_EAGER_IMPORT=1 forces
+# everything to be imported now, useful to validate deferred imports are not broken.
+if _sys.version_info < (3, 7) or _os.getenv("CI_EXEC_EAGER_IMPORT", "0") == "1":
+    for _name in _lazy_imports:
+        __getattr__(_name)
+    del _name
@@ -15,8 +15,10 @@
 ########################################################################################
 """Various utilities for colorizing terminal output."""
 
-import shutil
-from typing import Optional
+import os
+import sys
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 
 class Ansi:
@@ -56,13 +58,15 @@ class Colors:
     White = "37"
     """The white ANSI color."""
 
+    _all_colors = (Black, Red, Green, Yellow, Blue, Magenta, Cyan, White)
+    _all_color_names = (
+        "Black", "Red", "Green", "Yellow", "Blue", "Magenta", "Cyan", "White"
+    )
+
     @classmethod
     def all_colors(cls) -> tuple:
         """Return a tuple of all string colors available (used in tests)."""
-        return (
-            Colors.Black, Colors.Red, Colors.Green, Colors.Yellow, Colors.Blue,
-            Colors.Magenta, Colors.Cyan, Colors.White
-        )
+        return cls._all_colors
 
 
 class Styles:
@@ -106,14 +110,31 @@ class Styles:
     DimUnderlineInverted = "2;4;7"
     """Dim, underlined, and inverted ANSI format."""
 
+    _all_styles = (
+        Regular, Bold, Dim, Underline, Inverted, BoldUnderline, BoldInverted,
+        BoldUnderlineInverted, DimUnderline, DimInverted, DimUnderlineInverted
+    )
+    _all_style_names = (
+        "Regular", "Bold", "Dim", "Underline", "Inverted", "BoldUnderline",
+        "BoldInverted", "BoldUnderlineInverted", "DimUnderline", "DimInverted",
+        "DimUnderlineInverted"
+    )
+
     @classmethod
     def all_styles(cls) -> tuple:
         """Return a tuple of all style strings available (used in tests)."""
-        return (
-            Styles.Regular, Styles.Bold, Styles.Dim, Styles.Underline, Styles.Inverted,
-            Styles.BoldUnderline, Styles.BoldInverted, Styles.BoldUnderlineInverted,
-            Styles.DimUnderline, Styles.DimInverted, Styles.DimUnderlineInverted
-        )
+        return cls._all_styles
+
+
+# See https://no-color.org/, only checked once when this module is imported.
+_no_color = os.getenv("NO_COLOR", "") != ""
+
+# Module level aliases of Ansi to skip the class attribute lookup in colorize.
+_ansi_escape = Ansi.Escape
+_ansi_clear = Ansi.Clear
+
+# Cache of (color, style) => escape sequence prefix, colorize is called frequently.
+_prefix_cache = {}  # type: Dict[Tuple[str, str], str]
 
 
 def colorize(message: str, *, color: str, style: str = Styles.Regular) -> str:
@@ -126,6 +147,11 @@ def colorize(message: str, *, color: str, style: str = Styles.Regular) -> str:
         the ``m`` after.  For example, a ``color="32m"`` is invalid, it should just be
         ``"32"``.  Similarly, a ``style="1m"`` is invalid, it should just be ``"1"``.
 
+    .. note::
+
+        If the `NO_COLOR <https://no-color.org/>`_ environment variable is set to a
+        non-empty value when ``ci_exec`` is imported, ``message`` is returned as is.
+
     Parameters
     ----------
     message : str
@@ -147,30 +173,56 @@ def colorize(message: str, *, color: str, style: str = Styles.Regular) -> str:
     str
         The original message with the specified color escape sequence.
     """
-    prefix = f"{Ansi.Escape}{color}"
-    # Regular: `m` goes right after color without `;`
-    if style != "":
-        if not style.startswith(";"):
-            prefix += ";" + style
-    prefix += "m"
+    if _no_color:
+        return message
+
+    prefix = _prefix_cache.get((color, style))
+    if prefix is None:
+        prefix = f"{_ansi_escape}{color}"
+        # Regular: `m` goes right after color without `;`
+        if style != "":
+            if not style.startswith(";"):
+                prefix += ";" + style
+        prefix += "m"
+        _prefix_cache[(color, style)] = prefix
 
-    return f"{prefix}{message}{Ansi.Clear}"
+    return prefix + message + _ansi_clear
 
 
 def dump_predefined_color_styles():
     """Dump all predefined |Colors| in every |Styles| to the console."""
-    for c_key in Colors.__dict__.keys():
-        if not c_key[0].isupper():
-            continue
-        color = getattr(Colors, c_key)
-        for s_key in Styles.__dict__.keys():
-            if not s_key[0].isupper():
-                continue
-            style = getattr(Styles, s_key)
-
+    for c_key, color in zip(Colors._all_color_names, Colors._all_colors):
+        for s_key, style in zip(Styles._all_style_names, Styles._all_styles):
             print(colorize(f"color={c_key}, style={s_key}", color=color, style=style))
 
 
+@lru_cache(maxsize=None)
+def _terminal_width() -> int:
+    # The terminal width does not change over the course of a CI job, only ask once.
+    # Call _terminal_width.cache_clear() if it needs to be queried again.
+    import shutil  # only needed here, keep it out of `import ci_exec`
+    return shutil.get_terminal_size().columns
+
+
+@lru_cache(maxsize=128)
+def _stage_line(stage: str, fill_char: str, l_pad: str, r_pad: str,
+                full_width: int) -> str:
+    # The un-colorized log_stage message.  CI scripts typically log the same handful of
+    # stages at a fixed width, so these are cached.
+    pad_width = len(l_pad) + len(r_pad)
+    stage_width = len(stage) + pad_width
+    fill_width = full_width - stage_width
+    # If it's too long to add at least (fill_width - 1) / 2 fill_char's, just print the
+    # message as is (as stated in docs, no fancy workarounds are created).
+    if fill_width < 3:
+        return stage
+
+    # When fill_width is odd, add an extra fill_char on the right to fill the screen.
+    fill = fill_char * (fill_width // 2)
+    extra = "" if fill_width % 2 == 0 else fill_char
+    return f"{fill}{l_pad}{stage}{r_pad}{extra}{fill}"
+
+
 def log_stage(stage: str, *, fill_char: str = "=", pad: str = " ",
               l_pad: Optional[str] = None, r_pad: Optional[str] = None,
               color: Optional[str] = Colors.Green, style: str = Styles.Bold,
@@ -185,8 +237,9 @@ def log_stage(stage: str, *, fill_char: str = "=", pad: str = " ",
         ======================== CMake.Configure ========================
 
     By default, this will be printed using ANSI bold green to make it stick out.  If the
-    terminal size cannot be obtained, a width of ``80`` is assumed.  Specify ``width``
-    if fixed width is desired.
+    terminal size cannot be obtained, a width of ``80`` is assumed.  The terminal size
+    is only queried on the first call and reused afterward.  Specify ``width`` if fixed
+    width is desired.
 
     .. note::
 
@@ -236,7 +289,8 @@ def log_stage(stage: str, *, fill_char: str = "=", pad: str = " ",
 
     color : str or None
         The ANSI color code to use with |colorize|.  If no coloring is desired, call
-        this function with ``color=None`` to disable.
+        this function with ``color=None`` to disable.  Coloring is also disabled when
+        the ``NO_COLOR`` environment variable is set (see |colorize|).
 
     style : str
         The ANSI style specification to use with |colorize|.  If no coloring is desired,
@@ -263,35 +317,24 @@ def log_stage(stage: str, *, fill_char: str = "=", pad: str = " ",
         printing to :data:`python:sys.stdout`.
     """
     # Get desired width of output to format to.
-    full_width = width or shutil.get_terminal_size().columns
+    full_width = width or _terminal_width()
 
     if l_pad is None:
         l_pad = pad
     if r_pad is None:
         r_pad = pad
 
-    # Compute usable areas to fill.
-    pad_width = len(l_pad) + len(r_pad)
-    stage_width = len(stage) + pad_width
-    fill_width = full_width - stage_width
-    # If it's too long to add at least (fill_width - 1) / 2 fill_char's, just print the
-    # message as is (as stated in docs, no fancy workarounds are created).
-    if fill_width < 3:
-        message = stage
-    else:
-        prefix_suffix = l_pad
-        suffix_prefix = r_pad
-        if fill_width % 2 == 0:
-            fill = fill_char * (fill_width // 2)
-        else:
-            fill = fill_char * ((fill_width - 1) // 2)
-            # Add an extra fill_char on suffix to fill screen.
-            suffix_prefix = f"{suffix_prefix}{fill_char}"
-
-        # Create the full width message, colorize, and print.
-        prefix = f"{fill}{prefix_suffix}"
-        suffix = f"{suffix_prefix}{fill}"
-        message = f"{prefix}{stage}{suffix}"
-    if color:
+    message = _stage_line(stage, fill_char, l_pad, r_pad, full_width)
+    if color and not _no_color:
         message = colorize(message, color=color, style=style)
-    print(message, **kwargs)
+    # print() writes the message and `end` separately, use a single write instead.
+    # NOTE: `sep` is left to print(), which validates it even for a single message.
+    if kwargs.keys() <= {"end", "file", "flush"}:
+        file = kwargs.get("file") or sys.stdout
+        if file is not None:
+            end = kwargs.get("end")
+            file.write(message + ("\n" if end is None else end))
+            if kwargs.get("flush"):
+                file.flush()
+    else:
+        print(message, **kwargs)  # Let print raise on invalid arguments.
@@ -16,15 +16,24 @@
 """The core functionality of the ``ci_exec`` package."""
 
 import os
-import re
-import shutil
-import subprocess
+import stat
 import sys
+from contextlib import contextmanager
 from pathlib import Path
-from typing import NoReturn, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NoReturn, Optional, \
+    Sequence, TYPE_CHECKING, Tuple, Union
 
 from .colorize import Colors, Styles, colorize
 
+if TYPE_CHECKING:  # pragma: no cover
+    import subprocess
+
+# NOTE: shutil and subprocess are imported where they are needed, so that importing
+# this module (e.g., `from ci_exec import fail`) does not pay for them up front.
+
+# The bold red prefix for fail(), it never changes so only create it once.
+_fail_prefix = colorize("[X] ", color=Colors.Red, style=Styles.Bold)
+
 
 def fail(why: str, *, exit_code: int = 1, no_prefix: bool = False) -> NoReturn:
     """
@@ -45,7 +54,7 @@ def fail(why: str, *, exit_code: int = 1, no_prefix: bool = False) -> NoReturn:
     if no_prefix:
         prefix = ""
     else:
-        prefix = colorize("[X] ", color=Colors.Red, style=Styles.Bold)
+        prefix = _fail_prefix
     sys.stderr.write(f"{prefix}{why}\n")
     sys.exit(exit_code)
 
@@ -100,7 +109,8 @@ class Executable:
 
     log_calls : bool
         Whether or not every invocation of :func:`__call__` should print what will
-        execute before executing it.  Default: ``True``.
+        execute before executing it.  Arguments are quoted as needed so the printed
+        command can be copied into a shell.  Default: ``True``.
 
     log_prefix : str
         The prefix to use when printing a given invocation of :func:`__call__`.
@@ -123,14 +133,11 @@ class Executable:
         If ``exe_path`` is not a file, or if it is not executable.
     """
 
-    PATH_EXTENSIONS = set(
-        filter(
-            # Filter empty strings so we can just check `if Executable.PATH_EXTENSIONS`
-            lambda x: x != "",
-            # Map all values to lowercase for consistency
-            map(lambda x: x.lower(), os.getenv("PATHEXT", "").split(os.pathsep))
-        )
-    )
+    # Filter empty strings so we can just check `if Executable.PATH_EXTENSIONS`, and map
+    # all values to lowercase for consistency.
+    PATH_EXTENSIONS = {
+        ext.lower() for ext in os.getenv("PATHEXT", "").split(os.pathsep) if ext
+    }
     """
     The set of valid file extensions that can be executed on Windows.
 
@@ -144,29 +151,27 @@ class Executable:
     def __init__(self, exe_path: str, *, log_calls: bool = True,
                  log_prefix: str = "$ ", log_color: Optional[str] = Colors.Cyan,
                  log_style: str = Styles.Bold):
-        p = Path(exe_path)
-        if not p.is_file():
+        if not os.path.isfile(exe_path):
             raise ValueError(f"The path '{exe_path}' is not a file.")
         # NOTE: this check does not really apply to Windows.
         if not os.access(exe_path, os.X_OK):
             raise ValueError(f"The path '{exe_path}' is not executable.")
         # On Windows, check that this file can be executed directly using PATHEXT.
         if Executable.PATH_EXTENSIONS:
-            if p.suffix.lower() not in Executable.PATH_EXTENSIONS:
+            exts = tuple(Executable.PATH_EXTENSIONS)
+            if not os.fspath(exe_path).lower().endswith(exts):
                 raise ValueError(f"Extension of '{exe_path}' is not in PATHEXT.")
 
         # Store paths as absolute paths so that users can change working directory
-        # without needing to worry about relative paths.
-        if not p.is_absolute():
-            p = p.resolve()
-
-        self.exe_path = str(p)
+        # without needing to worry about relative paths.  NOTE: abspath does not touch
+        # the filesystem, symbolic links are not resolved.
+        self.exe_path = os.path.abspath(exe_path)
         self.log_calls = log_calls
         self.log_prefix = log_prefix
         self.log_color = log_color
         self.log_style = log_style
 
-    def __call__(self, *args, **kwargs) -> subprocess.CompletedProcess:
+    def __call__(self, *args, **kwargs) -> "subprocess.CompletedProcess":
         """
         Run :attr:`exe_path` with the specified command-line ``*args``.
 
@@ -219,6 +224,25 @@ class Executable:
             The final ``git("not-a-command")`` exited the shell (this is what is meant
             by "failing by default").
 
+            The one exception is ``cached``, which is not forwarded.  When
+            ``cached=True``, a successful result is saved to disk and returned by any
+            later call (including from later runs of the script) with the same
+            arguments, ``cwd``, and ``**kwargs`` rather than running again, as long as
+            the executable itself has not changed (size and modification time):
+
+            .. code-block:: python
+
+                >>> proc = git("--version", stdout=PIPE, cached=True)
+
+            Cached results never expire, so only use this for commands whose output
+            depends on nothing but the executable and its arguments (e.g., **not**
+            ``git rev-parse HEAD``).  Only the explicit ``env`` argument is considered,
+            not the inherited environment.  Since nothing is printed on a cache hit,
+            this is intended to be used while capturing the output.  Results are
+            stored as plain JSON data in
+            ``$CI_EXEC_CACHE_DIR`` (default: ``~/.cache/ci_exec``), and
+            ``CI_EXEC_NO_CACHE=1`` disables the cache.
+
         Return
         ------
         subprocess.CompletedProcess
@@ -229,46 +253,400 @@ class Executable:
                 Unless you are are calling with ``check=False``, you generally don't
                 need to store the return type.
         """
+        import subprocess
+
         popen_args = (self.exe_path, *args)
-        if self.log_calls:
-            message = f"{self.log_prefix}{' '.join(popen_args)}"
-            if self.log_color:
-                message = colorize(message, color=self.log_color, style=self.log_style)
-            print(message)
+        self._log_call(popen_args)
+        cached = kwargs.pop("cached", False)
         try:
             # By default non-zero exit codes should terminate.
             if "check" not in kwargs:
                 kwargs["check"] = True
+            if cached and os.getenv("CI_EXEC_NO_CACHE", "0") != "1":
+                return _cached_run(popen_args, kwargs)
             return subprocess.run(popen_args, **kwargs)
         except Exception as e:
-            # Provide a little more context for the user, the actual error message will
-            # be something like '__init__() got an unexpected keyword argument', which
-            # may confuse people who don't understand that __call__ -> subprocess.run()
-            # actually instantiates a subprocess.Popen object.
-            if isinstance(e, TypeError):
-                err_msg = (
-                    f"Executable.__call__: invalid kwarg(s) for subprocess.run: {e}"
-                )
-            else:
-                err_msg = f"{e}"
-            # Try and mirror the exit code if possible, subprocess.run will raise an
-            # exception when check=True, but this may not necessarily be why this code
-            # is executing.
-            # NOTE: 3.5 has no ending period, 3.6+ do.
-            match = re.match(r".*non-zero exit status (\d+)\.?", err_msg)
-            if match:
-                try:
-                    exit_code = int(match.group(1))
-                except:  # noqa: E722 # pragma: no cover
-                    exit_code = 1     # pragma: no cover
-            else:
-                exit_code = 1
-            fail(err_msg, exit_code=exit_code)
+            _fail_from_exception(e)
+
+    def stream(self, *args, on_line: Optional[Callable[[str], Any]] = None,
+               **kwargs) -> "subprocess.CompletedProcess":
+        """
+        Run :attr:`exe_path` with ``*args``, forwarding the output one line at a time.
+
+        Where ``exe(*args, stdout=subprocess.PIPE)`` holds the entire output in memory
+        until the process finishes, this method hands every line of output (as a
+        :class:`python:str`) to ``on_line`` as soon as it is available::
+
+            ctest = which("ctest")
+            failures = []
+
+            def on_line(line: str):
+                sys.stdout.write(line)
+                if "***Failed" in line:
+                    failures.append(line)
+
+            ctest("--output-on-failure", on_line=on_line)
+
+        By default ``stderr`` is merged into ``stdout``.  As with :func:`__call__`, the
+        call is logged and a non-zero exit code results in a call to |fail| unless
+        ``check=False`` is provided.
+
+        Parameters
+        ----------
+        *args
+            The command-line arguments, see :func:`__call__`.
+
+        on_line : Callable[[str], Any] or None
+            Called with every line of output (including the trailing newline).
+            Default: ``None``, write to :data:`python:sys.stdout`.
+
+        **kwargs
+            Forwarded to :class:`python:subprocess.Popen`, except for ``check`` (default
+            ``True``).  ``stdout`` may not be provided, provide ``stderr`` to stop it
+            from being merged into ``stdout``.
+
+        Return
+        ------
+        subprocess.CompletedProcess
+            The ``args`` and ``returncode`` of the process (``stdout`` is ``None``).
+        """
+        import subprocess
+
+        popen_args = (self.exe_path, *args)
+        self._log_call(popen_args)
+        check = kwargs.pop("check", True)
+        if "stderr" not in kwargs:
+            kwargs["stderr"] = subprocess.STDOUT
+        write = on_line or sys.stdout.write
+        try:
+            proc = subprocess.Popen(
+                popen_args, stdout=subprocess.PIPE, bufsize=1, universal_newlines=True,
+                **kwargs
+            )
+        except Exception as e:
+            _fail_from_exception(
+                e, where="Executable.stream", target="subprocess.Popen"
+            )
+
+        try:
+            for line in proc.stdout:  # type: ignore
+                write(line)
+        except BaseException:
+            proc.kill()
+            raise
+        finally:
+            proc.stdout.close()  # type: ignore
+            proc.wait()
+
+        if check and proc.returncode != 0:
+            _fail_from_exception(
+                subprocess.CalledProcessError(proc.returncode, popen_args)
+            )
+        return subprocess.CompletedProcess(popen_args, proc.returncode)
+
+    def map(self, args_list: Iterable[Sequence[str]], *, workers: Optional[int] = None,
+            mode: str = "thread", **kwargs) -> List["subprocess.CompletedProcess"]:
+        """
+        Run :attr:`exe_path` once for every entry of ``args_list`` concurrently.
+
+        Each entry of ``args_list`` is the ``*args`` of a single :func:`__call__`::
+
+            clang_format = which("clang-format")
+            clang_format.map([("-i", f) for f in sources], workers=4)
+
+        Every invocation is logged (if :attr:`log_calls`) before any of them start.
+        Failures are only reported after **all** invocations have finished, the first
+        failure (in ``args_list`` order) results in a call to |fail|.
+
+        .. note::
+
+            Unless ``stdout`` / ``stderr`` are redirected (e.g., ``subprocess.PIPE``),
+            the output of the concurrent invocations will be interleaved.
+
+        Parameters
+        ----------
+        args_list
+            An iterable of argument sequences, one per invocation.
+
+        workers : int or None
+            The maximum number of concurrent invocations.  Default: ``None``, use the
+            default of the :mod:`python:concurrent.futures` executor.
+
+        mode : str
+            Either ``"thread"`` (default) or ``"process"``.  The work being done is
+            in the child processes, so a :class:`~python:concurrent.futures.ThreadPoolExecutor`
+            is almost always sufficient.  Use ``"process"`` to dispatch invocations
+            from a :class:`~python:concurrent.futures.ProcessPoolExecutor` instead.
+
+        **kwargs
+            Forwarded to :func:`python:subprocess.run` for every invocation, with the
+            same implicit ``check=True`` as :func:`__call__`.
+
+        Return
+        ------
+        list
+            The :class:`python:subprocess.CompletedProcess` of every invocation, in the
+            same order as ``args_list``.
+
+        Raises
+        ------
+        ValueError
+            If ``mode`` is not ``"thread"`` or ``"process"``.
+        """  # noqa: E501
+        if mode not in {"thread", "process"}:
+            raise ValueError(f"Executable.map: invalid mode '{mode}'.")
+
+        # By default non-zero exit codes should terminate.
+        if "check" not in kwargs:
+            kwargs["check"] = True
+
+        all_popen_args = [(self.exe_path, *args) for args in args_list]
+        for popen_args in all_popen_args:
+            self._log_call(popen_args)
+
+        import concurrent.futures as cf  # only needed here, import when used
+        if mode == "thread":
+            pool = cf.ThreadPoolExecutor(max_workers=workers)  # type: cf.Executor
+        else:
+            pool = cf.ProcessPoolExecutor(max_workers=workers)
+
+        # Leaving the `with` waits for everything, no running children are orphaned.
+        with pool:
+            all_futures = [
+                pool.submit(_run, popen_args, kwargs) for popen_args in all_popen_args
+            ]
+
+        results = []
+        for future in all_futures:
+            e = future.exception()
+            if e is not None:
+                _fail_from_exception(e, where="Executable.map")
+            results.append(future.result())
+        return results
+
+    def _log_call(self, popen_args: Tuple[str, ...]):
+        # Print what is about to be run according to the log_* attributes.  The log_*
+        # attributes may change at any time, colorize caches the escape sequences.
+        if self.log_calls:
+            message = self.log_prefix + _join_args(popen_args)
+            if self.log_color:
+                message = colorize(message, color=self.log_color, style=self.log_style)
+            sys.stdout.write(message + "\n")
+            # Flush so the command is logged before its output (e.g., piped CI logs).
+            sys.stdout.flush()
 
     def __str__(self):  # noqa: D105
         return f"Executable('{self.exe_path}')"
 
 
+def _join_args(popen_args: Tuple[str, ...]) -> str:
+    # Quote the arguments so that a logged command can be copy-pasted into a shell.
+    if sys.platform == "win32":
+        import subprocess
+        return subprocess.list2cmdline(popen_args)
+    import shlex
+    return " ".join(shlex.quote(arg) for arg in popen_args)
+
+
+def _run(popen_args: Tuple[str, ...],
+         kwargs: Dict[str, Any]) -> "subprocess.CompletedProcess":
+    # Module level so that it can be pickled by Executable.map(mode="process").
+    import subprocess
+    return subprocess.run(popen_args, **kwargs)
+
+
+def _cached_run(popen_args: Tuple[str, ...],
+                kwargs: Dict[str, Any]) -> "subprocess.CompletedProcess":
+    # Executable.__call__(cached=True): reuse the result of an earlier successful run.
+    import hashlib
+    import json
+    import subprocess
+
+    # The executable itself is part of the key: an in place upgrade invalidates it.
+    exe_stat = os.stat(popen_args[0])
+    cwd = kwargs.get("cwd")
+    key_kwargs = sorted(
+        (key, sorted(val.items()) if key == "env" and val is not None else val)
+        for key, val in kwargs.items() if key != "check"
+    )
+    key = repr((
+        popen_args, exe_stat.st_mtime_ns, exe_stat.st_size,
+        os.getcwd() if cwd is None else os.path.abspath(cwd), key_kwargs
+    ))
+    cache_dir = os.getenv("CI_EXEC_CACHE_DIR") or \
+        os.path.join(os.path.expanduser("~"), ".cache", "ci_exec")
+    cache_file = os.path.join(
+        cache_dir, hashlib.blake2b(key.encode("utf-8")).hexdigest() + ".json"
+    )
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            record = json.load(f)
+        if record["returncode"] != 0:
+            raise ValueError("only successful results are cached.")
+        return subprocess.CompletedProcess(
+            popen_args, 0, _decode_output(record["stdout"]),
+            _decode_output(record["stderr"])
+        )
+    except Exception:
+        pass  # Not cached yet (or unreadable / not a valid record), run it.
+
+    proc = subprocess.run(popen_args, **kwargs)
+    # Failures are never cached (or check=True already raised).  Saving the result is
+    # best effort, a cache that cannot be written should not fail the build.
+    if proc.returncode == 0:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_file = f"{cache_file}.{os.getpid()}"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({
+                    "returncode": proc.returncode,
+                    "stdout": _encode_output(proc.stdout),
+                    "stderr": _encode_output(proc.stderr)
+                }, f)
+            os.replace(tmp_file, cache_file)
+        except OSError:  # pragma: no cover
+            pass
+    return proc
+
+
+def _encode_output(output: Union[bytes, str, None]) -> Optional[Dict[str, str]]:
+    # Captured output as plain JSON data: raw bytes are stored base64 encoded.
+    import base64
+    if output is None:
+        return None
+    if isinstance(output, bytes):
+        return {"bytes": base64.b64encode(output).decode("ascii")}
+    return {"str": output}
+
+
+def _decode_output(record: Optional[Dict[str, str]]) -> Union[bytes, str, None]:
+    # Inverse of _encode_output, anything unexpected raises.
+    import base64
+    if record is None:
+        return None
+    if "bytes" in record:
+        return base64.b64decode(record["bytes"], validate=True)
+    output = record["str"]
+    if not isinstance(output, str):
+        raise ValueError("cached output is not a string.")
+    return output
+
+
+def _fail_from_exception(e: BaseException, *, where: str = "Executable.__call__",
+                         target: str = "subprocess.run") -> NoReturn:
+    import subprocess
+
+    # Provide a little more context for the user, the actual error message will
+    # be something like '__init__() got an unexpected keyword argument', which
+    # may confuse people who don't understand that __call__ -> subprocess.run()
+    # actually instantiates a subprocess.Popen object.  `where` is the function the
+    # user called, and `target` is what it forwarded the **kwargs to.
+    if isinstance(e, TypeError):
+        err_msg = f"{where}: invalid kwarg(s) for {target}: {e}"
+    else:
+        err_msg = f"{e}"
+    # Mirror the exit code if possible, subprocess.run will raise an exception when
+    # check=True, but this may not necessarily be why this code is executing.
+    # NOTE: a process killed by a signal has a negative returncode, use 1 instead.
+    if isinstance(e, subprocess.CalledProcessError) and e.returncode > 0:
+        exit_code = e.returncode
+    else:
+        exit_code = 1
+    fail(err_msg, exit_code=exit_code)
+
+
+@contextmanager
+def pipeline(*stages: Tuple[Executable, Sequence[str]], check: bool = True,
+             **kwargs) -> Iterator[Iterator[bytes]]:
+    """
+    Chain |Executable| invocations together like a shell pipeline.
+
+    The ``stdout`` of every stage is connected directly to the ``stdin`` of the next
+    stage using operating system pipes, the output is never buffered in python.  The
+    ``stdout`` of the last stage is made available as an iterator of lines (as
+    :class:`python:bytes`)::
+
+        from ci_exec import pipeline, which
+
+        git = which("git")
+        grep = which("grep")
+        # Same as: git ls-files | grep -F .py
+        with pipeline((git, ["ls-files"]), (grep, ["-F", ".py"])) as lines:
+            for line in lines:
+                print(line.decode("utf-8"), end="")
+
+    Every stage is logged by its |Executable| (if ``log_calls``) when it is launched.
+    After the ``with`` block all stages are waited on, and with ``check=True`` the
+    first stage that did not succeed results in a call to |fail|.
+
+    .. note::
+
+        If the ``with`` block does not consume all of the lines, the remaining stages
+        are terminated by ``SIGPIPE`` (on platforms that support it) and will not have
+        succeeded.  Use ``check=False`` when intentionally stopping early.
+
+    Parameters
+    ----------
+    *stages
+        Tuples of ``(executable, args)``, where ``args`` are the command-line arguments
+        for that stage.
+
+    check : bool
+        Whether to |fail| if any stage has a non-zero exit code.  Default: ``True``.
+
+    **kwargs
+        Forwarded to every :class:`python:subprocess.Popen`, e.g., ``cwd`` or ``env``.
+        ``stdin`` is only used by the first stage, ``stdout`` may not be provided.
+
+    Raises
+    ------
+    ValueError
+        If no ``stages`` are provided.
+    """
+    if len(stages) == 0:
+        raise ValueError("pipeline: at least one stage required.")
+
+    import subprocess
+
+    stdin = kwargs.pop("stdin", None)
+    all_popen_args = []
+    procs = []  # type: List[subprocess.Popen]
+    try:
+        for exe, args in stages:
+            popen_args = (exe.exe_path, *args)
+            exe._log_call(popen_args)
+            proc = subprocess.Popen(
+                popen_args, stdin=stdin, stdout=subprocess.PIPE, **kwargs
+            )
+            # The parent's copy of the upstream stdout must be closed, otherwise the
+            # upstream stage will not receive SIGPIPE if this stage exits early.
+            if procs:
+                procs[-1].stdout.close()  # type: ignore
+            all_popen_args.append(popen_args)
+            procs.append(proc)
+            stdin = proc.stdout
+    except Exception as e:
+        for proc in procs:
+            proc.kill()
+            proc.wait()
+        _fail_from_exception(e, where="pipeline", target="subprocess.Popen")
+
+    last_stdout = procs[-1].stdout
+    try:
+        yield iter(last_stdout)  # type: ignore
+    finally:
+        last_stdout.close()  # type: ignore
+        for proc in procs:
+            proc.wait()
+
+    if check:
+        for popen_args, proc in zip(all_popen_args, procs):
+            if proc.returncode != 0:
+                _fail_from_exception(
+                    subprocess.CalledProcessError(proc.returncode, popen_args)
+                )
+
+
 def mkdir_p(path: Union[Path, str], mode: int = 0o777, parents: bool = True,
             exist_ok: bool = True):
     """
@@ -299,12 +677,19 @@ def mkdir_p(path: Union[Path, str], mode: int = 0o777, parents: bool = True,
             will succeed.  If the path exists and is a **file**, even with
             ``exist_ok=True`` the command will |fail|.
     """
-    if isinstance(path, str):
-        path = Path(path)
+    path = os.fspath(path)
     try:
-        path.mkdir(mode=mode, parents=parents, exist_ok=exist_ok)
+        if parents:
+            os.makedirs(path, mode=mode, exist_ok=exist_ok)
+        else:
+            try:
+                os.mkdir(path, mode=mode)
+            except OSError:
+                # Same as pathlib: an existing *directory* is only ok with exist_ok.
+                if not exist_ok or not os.path.isdir(path):
+                    raise
     except Exception as e:
-        fail(f"Unable to mkdir_p '{str(path)}': {e}")
+        fail(f"Unable to mkdir_p '{path}': {e}")
 
 
 def rm_rf(path: Union[Path, str], ignore_errors: bool = False, onerror=None):
@@ -313,7 +698,7 @@ def rm_rf(path: Union[Path, str], ignore_errors: bool = False, onerror=None):
 
     This function simply checks if ``path`` exists first before calling
     :func:`python:shutil.rmtree`.  If the ``path`` does not exist, nothing is done.  If
-    the path exists but is a file, :meth:`python:pathlib.Path.unlink` is called instead.
+    the path exists but is not a directory, :func:`python:os.unlink` is called instead.
 
     Essentially, this function tries to behave like ``rm -rf``, but in the event that
     removal is not possible (e.g., due to insufficient permissions), the function will
@@ -331,17 +716,26 @@ def rm_rf(path: Union[Path, str], ignore_errors: bool = False, onerror=None):
     onerror
         See :func:`python:shutil.rmtree` for more information on the callback.
     """  # noqa: E501
-    if isinstance(path, str):
-        path = Path(path)
-    if not path.exists():
-        return
+    import shutil
+
+    path = os.fspath(path)
     try:
-        if path.is_file():
-            path.unlink()
+        # A single stat (following symlinks) rather than exists() and is_file().
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             return
-        shutil.rmtree(str(path), ignore_errors=ignore_errors, onerror=onerror)
+        if not stat.S_ISDIR(st.st_mode):
+            os.unlink(path)
+            return
+        shutil.rmtree(path, ignore_errors=ignore_errors, onerror=onerror)
     except Exception as e:
-        fail(f"Unable to remove '{str(path)}': {e}")
+        fail(f"Unable to remove '{path}': {e}")
+
+
+# Successful which() lookups: (cmd, mode, path) => exe_path.  Failures are not cached so
+# that a command installed later in the script can still be found.
+_which_cache = {}  # type: Dict[Tuple[str, int, str], str]
 
 
 def which(cmd: str, *, mode: int = (os.F_OK | os.X_OK), path: Optional[str] = None,
@@ -354,6 +748,9 @@ def which(cmd: str, *, mode: int = (os.F_OK | os.X_OK), path: Optional[str] = No
     |fail|.  If you need to conditionally check for a command, do **not** use this
     function, use :func:`python:shutil.which` instead.
 
+    Found commands are cached by ``cmd``, ``mode``, and ``path`` (or ``$PATH`` when
+    ``path`` is ``None``), so repeated lookups do not search ``$PATH`` again.
+
     Parameters
     ----------
     cmd : str
@@ -392,7 +789,78 @@ def which(cmd: str, *, mode: int = (os.F_OK | os.X_OK), path: Optional[str] = No
     Executable
         An executable created with the full path to the found ``cmd``.
     """
+    exe = _which(cmd, mode, path, **kwargs)
+    if exe is None:
+        fail(f"Could not find '{cmd}' in $PATH.")
+    return exe
+
+
+def _which(cmd: str, mode: int, path: Optional[str], **kwargs) -> Optional[Executable]:
+    # which() without the failure: the cached lookup, or None when cmd is not found.
+    # NOTE: shutil.which uses $PATH when path is None, it must be part of the key.
+    key = (cmd, mode, os.environ.get("PATH", os.defpath) if path is None else path)
+    exe_path = _which_cache.get(key)
+    if exe_path is not None:
+        try:
+            return Executable(exe_path, **kwargs)
+        except ValueError:
+            # Removed (or no longer executable) since it was found, search again.
+            del _which_cache[key]
+
+    import shutil
     exe_path = shutil.which(cmd, mode=mode, path=path)
     if exe_path is None:
-        fail(f"Could not find '{cmd}' in $PATH.")
+        return None
+    # Relative $PATH entries produce relative results that depend on the current
+    # working directory, only absolute results can be reused.
+    if os.path.isabs(exe_path):
+        _which_cache[key] = exe_path
     return Executable(exe_path, **kwargs)
+
+
+def which_many(cmds: Sequence[str], *, mode: int = (os.F_OK | os.X_OK),
+               path: Optional[str] = None, **kwargs) -> Dict[str, Executable]:
+    """
+    Resolve several commands at once, |fail| if any of them are not found.
+
+    Equivalent to calling |which| for each of ``cmds`` (sharing its cache), except that
+    the error message lists **all** of the commands that could not be found rather than
+    only the first.  Useful for scripts that need many tools up front::
+
+        tools = which_many(["git", "cmake", "ninja"])
+        git = tools["git"]
+
+    Parameters
+    ----------
+    cmds : Sequence[str]
+        The names of the commands to search for.  E.g., ``["cmake", "ninja"]``.
+
+    mode : int
+        The flag permission mask.  Default: ``(os.F_OK | os.X_OK)``, see |which|.
+
+    path : str or None
+        Default: ``None``.  See :func:`python:shutil.which`.
+
+    **kwargs
+        Forwarded to the |Executable| constructor of every command found.
+
+    Return
+    ------
+    Dict[str, Executable]
+        A mapping of each of ``cmds`` to the |Executable| found.
+    """
+    found = {}  # type: Dict[str, Executable]
+    missing = []  # type: List[str]
+    for cmd in cmds:
+        if cmd in found or cmd in missing:
+            continue
+        exe = _which(cmd, mode, path, **kwargs)
+        if exe is None:
+            missing.append(cmd)
+        else:
+            found[cmd] = exe
+
+    if missing:
+        names_missing = ", ".join(f"'{cmd}'" for cmd in missing)
+        fail(f"Could not find {names_missing} in $PATH.")
+    return found
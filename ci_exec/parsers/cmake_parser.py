@@ -20,6 +20,22 @@ from typing import Any, Dict, Optional
 
 from .utils import env_or_platform_default
 
+# Configure arguments that only depend on --shared / --static and the default
+# --build-type choices.
+_shared_arg = {True: "-DBUILD_SHARED_LIBS=ON", False: "-DBUILD_SHARED_LIBS=OFF"}
+_build_type_arg = {
+    build_type: f"-DCMAKE_BUILD_TYPE={build_type}"
+    for build_type in ("Release", "Debug", "RelWithDebInfo", "MinSizeRel")
+}
+
+
+class _DefaultsHelpFormatter(argparse.ArgumentDefaultsHelpFormatter):
+    # Like argparse.ArgumentDefaultsHelpFormatter, but "(default: None)" is not useful.
+    def _get_help_string(self, action: argparse.Action) -> Optional[str]:
+        if action.default is None:
+            return action.help
+        return super()._get_help_string(action)
+
 
 class CMakeParser(argparse.ArgumentParser):
     """
@@ -291,21 +307,40 @@ class CMakeParser(argparse.ArgumentParser):
     __ https://cmake.org/cmake/help/latest/manual/cmake-generators.7.html#other-generators
     """  # noqa: E501
 
+    # Computed once rather than on every is_*_config_generator call / construction.
+    _multi_config_generators = frozenset(
+        visual_studio_generators | other_generators | ninja_multi_generator
+    )
+    _single_config_generators = frozenset(makefile_generators | ninja_generator)
+    _all_generator_choices = tuple(
+        sorted(_multi_config_generators | _single_config_generators)
+    )
+
+    # Attributes that set_argument may change, and the names of the generator argument.
+    _set_argument_supported_keys = frozenset(
+        {"default", "choices", "required", "help", "metavar"}
+    )
+    _generator_names = frozenset({"-G", "generator"})
+
+    # Names that may not be given to add_argument ("extra_args" if add_extra_args).
+    _reserved_names = frozenset(
+        {"cmake_configure_args", "cmake_build_args", "extra_args"}
+    )
+
     @classmethod
     def is_multi_config_generator(cls, generator: str) -> bool:
         """Whether or not string ``generator`` is a multi-config generator."""
-        return generator in (cls.visual_studio_generators | cls.other_generators |
-                             cls.ninja_multi_generator)
+        return generator in cls._multi_config_generators
 
     @classmethod
     def is_single_config_generator(cls, generator: str) -> bool:
         """Whether or not string ``generator`` is a single-config generator."""
-        return generator in (cls.makefile_generators | cls.ninja_generator)
+        return generator in cls._single_config_generators
 
     def __init__(self, *, add_extra_args: bool = True,
                  shared_or_static_required: bool = False, **kwargs):
         if "formatter_class" not in kwargs:
-            kwargs["formatter_class"] = argparse.ArgumentDefaultsHelpFormatter
+            kwargs["formatter_class"] = _DefaultsHelpFormatter
         self.add_extra_args = add_extra_args  # see parse_args
         self.flag_map = {}  # type: Dict[str, argparse.Action]
         self.dest_map = {}  # type: Dict[str, argparse.Action]
@@ -317,11 +352,7 @@ class CMakeParser(argparse.ArgumentParser):
         self._register_argument(
             "-G", dest="generator", type=str, default="Ninja", metavar="GENERATOR",
             help="Generator to use (CMake -G flag).",
-            choices=sorted(
-                self.makefile_generators | self.ninja_generator |
-                self.ninja_multi_generator | self.visual_studio_generators |
-                self.other_generators
-            )
+            choices=self._all_generator_choices
         )
 
         # Architecture configure argument.
@@ -421,14 +452,16 @@ class CMakeParser(argparse.ArgumentParser):
             If :attr:`add_extra_args` is ``True``, then ``extra_args`` is also reserved
             and a value error will be raised if it is found in the positional ``*args``.
         """
-        if "cmake_configure_args" in args:
-            raise ValueError("'cmake_configure_args' name is reserved.")
-        if "cmake_build_args" in args:
-            raise ValueError("'cmake_build_args' name is reserved.")
-        if self.add_extra_args and "extra_args" in args:
-            raise ValueError(
-                "'extra_args' is reserved.  Set `add_extra_args = False` first."
-            )
+        reserved = self._reserved_names.intersection(args)
+        if reserved:
+            if "cmake_configure_args" in reserved:
+                raise ValueError("'cmake_configure_args' name is reserved.")
+            if "cmake_build_args" in reserved:
+                raise ValueError("'cmake_build_args' name is reserved.")
+            if self.add_extra_args:
+                raise ValueError(
+                    "'extra_args' is reserved.  Set `add_extra_args = False` first."
+                )
         return super().add_argument(*args, **kwargs)
 
     def get_argument(self, arg: str) -> Optional[argparse.Action]:
@@ -514,45 +547,41 @@ class CMakeParser(argparse.ArgumentParser):
 
         parsed_args = super().parse_args(args=args, namespace=namespace)
 
-        # NOTE: hasattr then check value pattern is because of the remove method, the
-        # user may have removed the argument so check it exists first.  The only one
-        # that is not allowed to be removed is the generator argument.
-        cmake_configure_args = []
-        cmake_build_args = []
-
-        # Initial generator / architecture / toolset setup.
-        cmake_configure_args.extend(["-G", parsed_args.generator])
-        if hasattr(parsed_args, "architecture") and parsed_args.architecture:
-            cmake_configure_args.extend(["-A", parsed_args.architecture])
-        if hasattr(parsed_args, "toolset") and parsed_args.toolset:
-            cmake_configure_args.extend(["-T", parsed_args.toolset])
-
-        # Setup BUILD_SHARED_LIBS if either --shared or --static requested.
-        if (hasattr(parsed_args, "shared") and parsed_args.shared) or \
-                (hasattr(parsed_args, "static") and parsed_args.static):
-            cmake_configure_args.append(
-                f"-DBUILD_SHARED_LIBS={'ON' if parsed_args.shared else 'OFF'}")
-
-        # Setup the default compilers for single config generators.
-        if self.is_single_config_generator(parsed_args.generator):
-            if hasattr(parsed_args, "cc") and parsed_args.cc:
-                cmake_configure_args.append(f"-DCMAKE_C_COMPILER={parsed_args.cc}")
-            if hasattr(parsed_args, "cxx") and parsed_args.cxx:
-                cmake_configure_args.append(f"-DCMAKE_CXX_COMPILER={parsed_args.cxx}")
-
-        # CMAKE_BUILD_TYPE at configure time for single config generators, and
-        # --config build_type build args for multi config generators.
-        if hasattr(parsed_args, "build_type") and parsed_args.build_type:
-            if self.is_multi_config_generator(parsed_args.generator):
-                cmake_build_args.extend(["--config", parsed_args.build_type])
-            else:
-                cmake_configure_args.append(
-                    f"-DCMAKE_BUILD_TYPE={parsed_args.build_type}")
-
-        # Add any extra arguments that may be requested after -- sequence.
-        if hasattr(parsed_args, "extra_args"):
-            for arg in parsed_args.extra_args:
-                cmake_configure_args.append(arg)
+        # NOTE: get() on a snapshot of the parsed values is because of the remove
+        # method, the user may have removed the argument.  The only one that is not
+        # allowed to be removed is the generator argument.
+        parsed = vars(parsed_args)
+        generator = parsed["generator"]
+        architecture = parsed.get("architecture")
+        toolset = parsed.get("toolset")
+        shared = parsed.get("shared")
+        static = parsed.get("static")
+        cc = parsed.get("cc")
+        cxx = parsed.get("cxx")
+        build_type = parsed.get("build_type")
+        # Compilers are only for single config generators.  Build type is configured
+        # for single config generators (CMAKE_BUILD_TYPE), and a --config build_type
+        # build arg for multi config generators.
+        single_config = self.is_single_config_generator(generator)
+        multi_config = self.is_multi_config_generator(generator)
+
+        cmake_configure_args = [
+            "-G", generator,
+            *(["-A", architecture] if architecture else ()),
+            *(["-T", toolset] if toolset else ()),
+            # Setup BUILD_SHARED_LIBS if either --shared or --static requested.
+            *([_shared_arg[bool(shared)]] if shared or static else ()),
+            *([f"-DCMAKE_C_COMPILER={cc}"] if single_config and cc else ()),
+            *([f"-DCMAKE_CXX_COMPILER={cxx}"] if single_config and cxx else ()),
+            # NOTE: choices may have been changed with set_argument.
+            *([_build_type_arg.get(build_type) or f"-DCMAKE_BUILD_TYPE={build_type}"]
+              if build_type and not multi_config else ()),
+            # Add any extra arguments that may be requested after -- sequence.
+            *parsed.get("extra_args", ())
+        ]
+        cmake_build_args = [
+            *(["--config", build_type] if build_type and multi_config else ())
+        ]
 
         # Make the parsed results available to the user and return.
         parsed_args.cmake_configure_args = cmake_configure_args
@@ -597,6 +626,7 @@ class CMakeParser(argparse.ArgumentParser):
             If any arguments requested to be removed have not been found.  This should
             only happen if (a) there was a typo, or (b) a user tries to remove an
             argument that was not registered.
+            None of the arguments are removed in this case.
         """
         if "generator" in args or "-G" in args:
             raise ValueError("'generator' argument may not be removed.")
@@ -607,31 +637,33 @@ class CMakeParser(argparse.ArgumentParser):
                 "`add_extra_args = False`."
             )
 
+        # Only support removing options that this parser class added (or more
+        # specifically, were registered).  Resolve everything first so that nothing is
+        # removed when any are missing, and so that an argument requested by both flag
+        # and dest is only removed once.
+        found = {}  # type: Dict[argparse.Action, None]
         missing = []
         for item in args:
-            # Only support removing options that this parser class added (or more
-            # specifically, were registered).
             found_arg = self._get_registered_argument(item)
             if found_arg:
-                if item in self.flag_map:
-                    del self.flag_map[item]
-                    del self.dest_map[found_arg.dest]
-                else:
-                    del self.flag_map[found_arg.option_strings[0]]
-                    del self.dest_map[item]
-
-                # See: https://bugs.python.org/issue19462#msg251739
-                # Only ok because we only support removing optional arguments, not
-                # positional arguments.
-                self._handle_conflict_resolve(  # type: ignore
-                    found_arg, [(found_arg.option_strings[0], found_arg)]
-                )
+                found[found_arg] = None
             else:
                 missing.append(item)
 
         if missing:
             raise ValueError(f"Cannot remove unregistered arg(s): {missing}")
 
+        for found_arg in found:
+            del self.flag_map[found_arg.option_strings[0]]
+            del self.dest_map[found_arg.dest]
+
+            # See: https://bugs.python.org/issue19462#msg251739
+            # Only ok because we only support removing optional arguments, not
+            # positional arguments.
+            self._handle_conflict_resolve(  # type: ignore
+                found_arg, [(found_arg.option_strings[0], found_arg)]
+            )
+
     def set_argument(self, arg: str, **attrs: Dict[str, Any]):
         """
         Set attributes for ``arg`` argument.
@@ -689,14 +721,13 @@ class CMakeParser(argparse.ArgumentParser):
             choices may not be changed (detection of single vs multi config generators
             will not be reliable).
         """
-        supported_keys = {"default", "choices", "required", "help", "metavar"}
-        if not attrs.keys() <= supported_keys:
-            disallowed = attrs.keys() - supported_keys
+        disallowed = attrs.keys() - self._set_argument_supported_keys
+        if disallowed:
             raise ValueError(
                 f"Setting attribute{'' if len(disallowed) == 1 else 's'} "
                 f"{disallowed} not supported.")
 
-        if arg in {"-G", "generator"} and "choices" in attrs:
+        if arg in self._generator_names and "choices" in attrs:
             raise ValueError(
                 "Changing 'generator' attribute 'choices' is not supported."
             )
@@ -20,6 +20,7 @@ In a nested module to avoid any circular import problems.
 """
 import os
 import platform
+from functools import lru_cache
 
 
 def env_or_platform_default(*, env: str, windows: str, darwin: str, other: str) -> str:
@@ -51,16 +52,20 @@ def env_or_platform_default(*, env: str, windows: str, darwin: str, other: str)
         Returned if ``env`` not set and |system| is neither ``"Windows"`` nor
         ``"Darwin"``.
     """
-    system = platform.system()
-    if system == "Windows":
-        default = windows
-    elif system == "Darwin":
-        default = darwin
-    else:
-        default = other
-
     val = os.getenv(env, None)
     if val is not None:
         return val
 
-    return default
+    return _platform_default(windows, darwin, other)
+
+
+@lru_cache(maxsize=None)
+def _platform_default(windows: str, darwin: str, other: str) -> str:
+    # The platform does not change, but the environment variable may (so it is not
+    # part of the cache).
+    system = platform.system()
+    if system == "Windows":
+        return windows
+    elif system == "Darwin":
+        return darwin
+    return other
@@ -18,11 +18,15 @@
 import difflib
 import re
 import shutil
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Match, Optional, Union
+from typing import Any, Callable, Match, Optional, Tuple, Union
 
 from .core import fail
 
+# Buffer size for line by line filtering, fewer read / write calls than the default.
+_line_buffer_size = 256 * 1024
+
 
 def filter_file(path: Union[Path, str], pattern: str,
                 repl: Union[Callable[[Match], str], str], count: int = 0,
@@ -87,53 +91,60 @@ def filter_file(path: Union[Path, str], pattern: str,
     """
     if isinstance(path, str):
         path = Path(path)
-    if not path.is_file():
-        fail(f"Cannot filter '{str(path)}', no such file!")
+    path_str = str(path)
     if backup_extension == "":
         fail("filter_file: 'backup_extension' may not be the empty string.")
     try:
+        # Compile once, rather than re.sub looking it up in the re cache for every line.
+        regex = re.compile(pattern, flags)
+
+        # Plain text patterns (nothing for re.escape to escape) with a plain replacement
+        # (no group references or escapes) can use the much faster str.replace.
+        if isinstance(pattern, str) and pattern and re.escape(pattern) == pattern and \
+                isinstance(repl, str) and "\\" not in repl and not flags and count >= 0:
+            def substitute(text: str) -> str:
+                return text.replace(pattern, repl, count or -1)  # type: ignore
+        else:
+            def substitute(text: str) -> str:
+                return regex.sub(repl, text, count=count)
+
         # Backup the original file before trying to filter.
-        backup = Path(str(path) + backup_extension)
-        shutil.copy(str(path), str(backup))
+        backup = Path(path_str + backup_extension)
+        try:
+            shutil.copyfile(path, backup)
+        except FileNotFoundError:
+            fail(f"Cannot filter '{path_str}', no such file!")
 
         # If doing line-based replacement, change access pattern.
         if line_based:
-            orig_contents = None
-            with backup.open(encoding=encoding) as orig_f:
-                with path.open("w", encoding=encoding) as new_f:
+            # Track changes while filtering, rather than reading both files again.
+            changed = False
+            with backup.open(encoding=encoding, buffering=_line_buffer_size) as orig_f:
+                with path.open("w", encoding=encoding,
+                               buffering=_line_buffer_size) as new_f:
                     for line in orig_f:
-                        new_f.write(re.sub(
-                            pattern, repl, line, count=count, flags=flags
-                        ))
+                        new_line = substitute(line)
+                        changed = changed or new_line != line
+                        new_f.write(new_line)
         else:
             # Gather the contents to be replaced.
-            with backup.open(encoding=encoding) as orig_f:
-                orig_contents = orig_f.read()
+            orig_contents = backup.read_text(encoding=encoding)
 
             # Do the replacement directly.
+            new_contents = substitute(orig_contents)
+            changed = new_contents != orig_contents
             with path.open("w", encoding=encoding) as new_f:
-                new_f.write(re.sub(
-                    pattern, repl, orig_contents, count=count, flags=flags
-                ))
+                new_f.write(new_contents)
 
         # If requested (by default), make sure something actually changed.
         if demand_different:
-            # In the line-based replacement we did not read the whole file at once.
-            if not orig_contents:
-                with backup.open(encoding=encoding) as orig_f:
-                    orig_contents = orig_f.read()
-
-            # Read in the file that may or may not have had changes applied.
-            with path.open(encoding=encoding) as new_f:
-                new_contents = new_f.read()
-
             # Enforce that the files are different ;)
-            if orig_contents == new_contents:
-                fail(f"filter_file: no changes made to '{str(path)}'")
+            if not changed:
+                fail(f"filter_file: no changes made to '{path_str}'")
 
         return backup
     except Exception as e:
-        fail(f"Unable to filter '{str(path)}': {e}")
+        fail(f"Unable to filter '{path_str}': {e}")
 
 
 def unified_diff(from_path: Union[Path, str], to_path: Union[Path, str], n: int = 3,
@@ -182,22 +193,26 @@ def unified_diff(from_path: Union[Path, str], to_path: Union[Path, str], n: int
         from_path = Path(from_path)
     if isinstance(to_path, str):
         to_path = Path(to_path)
-    if not from_path.is_file():
-        fail(f"unified_diff: from_path '{str(from_path)}' does not exist!")
-    if not to_path.is_file():
-        fail(f"unified_diff: to_path '{str(to_path)}' does not exist!")
+    from_str = str(from_path)
+    to_str = str(to_path)
 
     try:
         # difflib wants list of strings, read them in
-        with from_path.open(encoding=encoding) as from_file:
-            from_lines = from_file.readlines()
-        with to_path.open(encoding=encoding) as to_file:
-            to_lines = to_file.readlines()
+        try:
+            with from_path.open(encoding=encoding) as from_file:
+                from_lines = from_file.readlines()
+        except FileNotFoundError:
+            fail(f"unified_diff: from_path '{from_str}' does not exist!")
+        try:
+            with to_path.open(encoding=encoding) as to_file:
+                to_lines = to_file.readlines()
+        except FileNotFoundError:
+            fail(f"unified_diff: to_path '{to_str}' does not exist!")
 
         # Compute the unified diff <3
         diff_generator = difflib.unified_diff(
             from_lines, to_lines,
-            fromfile=str(from_path), tofile=str(to_path),
+            fromfile=from_str, tofile=to_str,
             n=n, lineterm=lineterm
         )
         diff_text = "".join(diff_generator)
@@ -207,16 +222,29 @@ def unified_diff(from_path: Union[Path, str], to_path: Union[Path, str], n: int
             return diff_text
 
         if not no_pygments:
-            try:
-                import pygments
-                from pygments import lexers, formatters
-                lex = lexers.find_lexer_class_by_name("diff")
-                fmt = formatters.get_formatter_by_name("console")
-                diff_text = pygments.highlight(diff_text, lex(), fmt)
-            except:  # noqa: E722
-                pass
+            pygments_diff = _pygments_diff()
+            if pygments_diff is not None:
+                highlight, lex, fmt = pygments_diff
+                try:
+                    diff_text = highlight(diff_text, lex, fmt)
+                except Exception:
+                    pass  # Keep the plain text.
 
         return diff_text
     except Exception as e:
-        fail(f"unified_diff: unable to diff '{str(from_path)}' with "
-             f"'{str(to_path)}': {e}")
+        fail(f"unified_diff: unable to diff '{from_str}' with "
+             f"'{to_str}': {e}")
+
+
+@lru_cache(maxsize=None)
+def _pygments_diff() -> Optional[Tuple[Callable[..., str], Any, Any]]:
+    # The (highlight, lexer, formatter) for unified_diff, or None if not available.
+    # Cached so that the lexer / formatter lookup is only done once.
+    try:
+        import pygments
+        from pygments import lexers, formatters
+        lex = lexers.find_lexer_class_by_name("diff")
+        fmt = formatters.get_formatter_by_name("console")
+        return (pygments.highlight, lex(), fmt)
+    except Exception:  # e.g., ImportError, or pygments.util.ClassNotFound
+        return None
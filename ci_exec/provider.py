@@ -16,7 +16,7 @@
 """Mechanisms to detect a given CI provider."""
 
 import os
-from typing import Callable, List, TYPE_CHECKING
+from typing import Callable, TYPE_CHECKING, Tuple
 
 # mypy has trouble inferring @provider as @staticmethod right now.  The solution will
 # not likely exist for a while, there are some deeper problems with typing and
@@ -47,6 +47,10 @@ else:
         return static_func
 
 
+# Environment variables checked by Provider.is_ci before querying every provider.
+_generic_ci_vars = ("CI", "CONTINUOUS_INTEGRATION")
+
+
 class ProviderMeta(type):
     """
     Metaclass for |Provider|.
@@ -59,13 +63,12 @@ class ProviderMeta(type):
 
     def __new__(cls, name, bases, attrs):  # noqa: D102
         the_cls = super().__new__(cls, name, bases, attrs)
-        _all_provider_functions = []
-        for key, val in attrs.items():
-            if getattr(val, "register_provider", False):
-                # NOTE: cannot append `val` directly, you will end up with
-                # 'staticmethod' is not callable.
-                _all_provider_functions.append(getattr(the_cls, key))
-        the_cls._all_provider_functions = _all_provider_functions
+        # NOTE: cannot store `val` directly, you will end up with 'staticmethod' is not
+        # callable.  Take the wrapped function instead.
+        the_cls._all_provider_functions = tuple(
+            val.__func__ for val in attrs.values()
+            if getattr(val, "register_provider", False)
+        )
         return the_cls
 
 
@@ -116,15 +119,15 @@ class Provider(object, metaclass=ProviderMeta):
 
     Attributes
     ----------
-    _all_provider_functions : list
-        **Not intended for external usage**.  The list of all known (implemented)
+    _all_provider_functions : tuple
+        **Not intended for external usage**.  The tuple of all known (implemented)
         CI provider functions in this class.  For example, it will contain
         :func:`Provider.is_appveyor`, ..., :func:`Provider.is_travis`, etc.  This is a
         **class** attribute, the ``Provider`` class is not intended to be instantiated.
     """
 
     # NOTE: only added here to make mypy happy.
-    _all_provider_functions = []  # type: List[Callable]
+    _all_provider_functions = ()  # type: Tuple[Callable, ...]
 
     @staticmethod
     def is_ci() -> bool:
@@ -142,12 +145,15 @@ class Provider(object, metaclass=ProviderMeta):
         +----------------------------+-----------------------------+
 
         If neither of these are ``true``, this function will query every provider
-        directly.  For example, it will end up checking if
-        ``any([Provider.is_appveyor(), ..., Provider.is_travis(), ...])``.
+        directly, stopping at the first one found.  For example, it will end up checking
+        ``Provider.is_appveyor() or ... or Provider.is_travis()``.
         """
-        return os.getenv("CI", "false").lower() == "true" or \
-            os.getenv("CONTINUOUS_INTEGRATION", "false") == "true" or \
-            any([provider() for provider in Provider._all_provider_functions])
+        env = os.environ
+        for var in _generic_ci_vars:
+            val = env.get(var)
+            if val is not None and val.lower() == "true":
+                return True
+        return any(provider() for provider in Provider._all_provider_functions)
 
     @provider
     def is_appveyor() -> bool:  # type: ignore
@@ -165,7 +171,8 @@ class Provider(object, metaclass=ProviderMeta):
         .. _AppVeyor: https://www.appveyor.com/
         .. _appveyor_env: https://www.appveyor.com/docs/environment-variables/
         """
-        return os.getenv("APPVEYOR", "false").lower() == "true"
+        val = os.environ.get("APPVEYOR")
+        return val is not None and val.lower() == "true"
 
     @provider
     def is_azure_pipelines() -> bool:
@@ -191,9 +198,9 @@ class Provider(object, metaclass=ProviderMeta):
         """  # noqa: E501
         # NOTE: in future this might get to change.
         # https://github.com/MicrosoftDocs/vsts-docs/issues/4051
-        return os.getenv("AZURE_HTTP_USER_AGENT", None) is not None and \
-            os.getenv("AGENT_NAME", None) is not None and \
-            os.getenv("BUILD_REASON", None) is not None
+        env = os.environ
+        return "AZURE_HTTP_USER_AGENT" in env and "AGENT_NAME" in env and \
+            "BUILD_REASON" in env
 
     @provider
     def is_circle_ci() -> bool:
@@ -211,7 +218,8 @@ class Provider(object, metaclass=ProviderMeta):
         .. _CircleCI: https://circleci.com/
         .. _circle_ci_env: https://circleci.com/docs/2.0/env-vars/#built-in-environment-variables
         """  # noqa: E501
-        return os.getenv("CIRCLECI", "false").lower() == "true"
+        val = os.environ.get("CIRCLECI")
+        return val is not None and val.lower() == "true"
 
     @provider
     def is_github_actions() -> bool:
@@ -229,7 +237,8 @@ class Provider(object, metaclass=ProviderMeta):
         .. _GitHub Actions: https://github.com/features/actions
         .. _github_actions_env: https://help.github.com/en/actions/configuring-and-managing-workflows/using-environment-variables#default-environment-variables
         """  # noqa: E501
-        return os.getenv("GITHUB_ACTIONS", "false").lower() == "true"
+        val = os.environ.get("GITHUB_ACTIONS")
+        return val is not None and val.lower() == "true"
 
     @provider
     def is_jenkins() -> bool:
@@ -251,8 +260,7 @@ class Provider(object, metaclass=ProviderMeta):
         .. _Jenkins: https://jenkins.io/
         .. _jenkins_env: https://wiki.jenkins.io/display/JENKINS/Building+a+software+project#Buildingasoftwareproject-belowJenkinsSetEnvironmentVariables
         """  # noqa: E501
-        return os.getenv("JENKINS_URL", None) is not None and \
-            os.getenv("BUILD_NUMBER", None) is not None
+        return "JENKINS_URL" in os.environ and "BUILD_NUMBER" in os.environ
 
     @provider
     def is_travis() -> bool:
@@ -270,4 +278,5 @@ class Provider(object, metaclass=ProviderMeta):
         .. _Travis: https://travis-ci.com/
         .. _travis_env: https://docs.travis-ci.com/user/environment-variables/#default-environment-variables
         """  # noqa: E501
-        return os.getenv("TRAVIS", "false").lower() == "true"
+        val = os.environ.get("TRAVIS")
+        return val is not None and val.lower() == "true"
@@ -23,7 +23,7 @@ of the ``ci_exec`` package.
 import os
 from contextlib import ContextDecorator
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, Set, Tuple, Union
 
 from .core import fail, mkdir_p
 
@@ -82,42 +82,43 @@ class cd(ContextDecorator):  # noqa: N801
     """
 
     def __init__(self, dest: Union[str, Path], *, create: bool = False):
-        if isinstance(dest, str):
-            dest = Path(dest)
-        dest = dest.expanduser()
-        if not dest.is_absolute():
-            # NOTE: python <3.6 resolve() throws, we need an absolute path to something
-            # that may not exist which is what this does.
-            dest = Path(os.path.abspath(str(dest)))
+        # NOTE: resolve() is avoided, we need an absolute path to something that may
+        # not exist which is what abspath does.
+        dest_str = os.path.abspath(os.path.expanduser(dest))
 
         self.create = create
-        self.dest = dest
+        self.dest = Path(dest_str)
+        self._dest_str = dest_str
         self.return_dest = None
 
     def __enter__(self):  # noqa: D105
         # If it does not exist, create it or fail.
-        if not self.dest.is_dir():
+        if not os.path.isdir(self._dest_str):
             if self.create:
                 mkdir_p(self.dest)  # May fail, if cannot create we want failure.
             else:
-                fail(f"cd: '{str(self.dest)}' is not a directory, but create=False.")
+                fail(f"cd: '{self._dest_str}' is not a directory, but create=False.")
         # Now that we are running, stash the current working directory at the time
         # this context is being created.
         try:
-            self.return_dest = Path.cwd()
+            cwd = os.getcwd()
         except Exception as e:
             fail(f"cd: could not get current working directory: {e}")
+        self.return_dest = cwd
+        # Already there, nothing to change.
+        if cwd == self._dest_str:
+            return self
         # At long last, actually change to the directory.
         try:
-            os.chdir(str(self.dest))
+            os.chdir(self._dest_str)
         except Exception as e:
-            fail(f"cd: could not change directories to '{str(self.dest)}': {e}")
+            fail(f"cd: could not change directories to '{self._dest_str}': {e}")
 
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):  # noqa: D105
         try:
-            os.chdir(str(self.return_dest))
+            os.chdir(self.return_dest)
         except Exception as e:
             fail(f"cd: could not return to {self.return_dest}: {e}")
 
@@ -169,8 +170,7 @@ def merge_kwargs(defaults: dict, kwargs: dict):
         The ``kwargs`` dictionary, possibly with values from ``defaults`` injected.
     """
     for key, val in defaults.items():
-        if key not in kwargs:
-            kwargs[key] = val
+        kwargs.setdefault(key, val)
 
     return kwargs
 
@@ -237,41 +237,46 @@ class set_env(ContextDecorator):  # noqa: N801
         # Make sure all values are strings (required by os.environ).  All keys are
         # implicitly strings -- constructing this class with non-string keys is a
         # TypeError via Python and how **kwargs works <3
-        for env_var, env_val in kwargs.items():
-            if not isinstance(env_val, str):
-                raise ValueError("set_env: all keys and values must be strings.")
+        if not all(isinstance(env_val, str) for env_val in kwargs.values()):
+            raise ValueError("set_env: all keys and values must be strings.")
 
         # Save state requested by user, do not inspect environment until __enter__.
-        self.set_env = {**kwargs}  # type: Dict[str, str]
+        self.set_env = kwargs  # type: Dict[str, str]
         self.restore_env = {}  # type: Dict[str, str]
-        self.delete_env = []  # type: List[str]
+        self.delete_env = set()  # type: Set[str]
 
     def __enter__(self):  # noqa: D105
-        for key, val in self.set_env.items():
+        env = os.environ
+        # Start from a clean slate, a decorated function may be called many times.
+        self.restore_env = restore_env = {}
+        self.delete_env = delete_env = set()
+        for key in self.set_env:
             # Create backups / record what needs to be deleted afterward.
-            curr = os.getenv(key, None)
-            if curr:
-                self.restore_env[key] = curr
+            # NOTE: an environment variable may be set to the empty string.
+            curr = env.get(key, None)
+            if curr is not None:
+                restore_env[key] = curr
             else:
-                self.delete_env.append(key)
+                delete_env.add(key)
 
-            # Set the actual environment variable
-            os.environ[key] = val
+        # Set the actual environment variables.
+        env.update(self.set_env)
 
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):  # noqa: D105
+        env = os.environ
         # Restore all previously set environment variables.
         for key, val in self.restore_env.items():
-            os.environ[key] = val
+            env[key] = val
 
         # Remove any environment variables that were not previously set.
         for key in self.delete_env:
             # NOTE: need to double check it is there, nested @set_env that set the same
             # variable will delete as the are __exit__ed, meaning an inner scope may
             # have already deleted this.
-            if key in os.environ:
-                del os.environ[key]
+            if key in env:
+                del env[key]
 
 
 class unset_env(ContextDecorator):  # noqa: N801
@@ -329,25 +334,29 @@ class unset_env(ContextDecorator):  # noqa: N801
             raise ValueError("unset_env: at least one argument required.")
 
         # Make sure every requested environment variable to unset is a string.
-        for a in args:
-            if not isinstance(a, str):
-                raise ValueError("unset_env: all arguments must be strings.")
+        if not all(isinstance(a, str) for a in args):
+            raise ValueError("unset_env: all arguments must be strings.")
 
         # Save state requested by user, do not inspect environment until __enter__.
-        self.unset_env = [*args]  # type: List[str]
+        self.unset_env = args  # type: Tuple[str, ...]
         self.restore_env = {}  # type: Dict[str, str]
 
     def __enter__(self):  # noqa: D105
+        env = os.environ
+        # Start from a clean slate, a decorated function may be called many times.
+        self.restore_env = restore_env = {}
         for key in self.unset_env:
-            curr = os.getenv(key, None)
-            if curr:
-                # If the variable is set, save its current value and then delete it.
-                self.restore_env[key] = curr
-                del os.environ[key]
+            curr = env.get(key, None)
+            if curr is not None:
+                # If the variable is set (possibly to the empty string), save its
+                # current value and then delete it.
+                restore_env[key] = curr
+                del env[key]
 
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):  # noqa: D105
+        env = os.environ
         # Restore all previously set environment variables.
         for key, val in self.restore_env.items():
-            os.environ[key] = val
+            env[key] = val
@@ -15,6 +15,7 @@
 ########################################################################################
 """Tests for the :mod:`ci_exec.colorize` module."""
 
+import importlib
 import re
 import shutil
 import sys
@@ -40,6 +41,8 @@ def test_all_colors():
         item for key, item in Colors.__dict__.items() if key[0].isupper()
     ])
     assert set(reported_all_colors) == all_colors
+    for name, color in zip(Colors._all_color_names, Colors._all_colors):
+        assert getattr(Colors, name) == color
 
 
 def test_all_styles():
@@ -56,6 +59,8 @@ def test_all_styles():
         item for key, item in Styles.__dict__.items() if key[0].isupper()
     ])
     assert set(reported_all_styles) == all_styles
+    for name, style in zip(Styles._all_style_names, Styles._all_styles):
+        assert getattr(Styles, name) == style
 
 
 @pytest.mark.parametrize(
@@ -75,6 +80,19 @@ def test_colorize(color: str, style: str):
     assert message in colored
 
 
+def test_no_color(capsys, monkeypatch):
+    """Validate |colorize| and |log_stage| skip colors when ``NO_COLOR`` is set."""
+    # NOTE: ci_exec.colorize is the function, not the module.
+    colorize_module = importlib.import_module("ci_exec.colorize")
+    monkeypatch.setattr(colorize_module, "_no_color", True)
+    assert colorize("colors!", color=Colors.Red, style=Styles.Bold) == "colors!"
+
+    log_stage("CMake.Configure", width=20)
+    captured = capsys.readouterr()
+    assert captured.out == "= CMake.Configure ==\n"
+    assert Ansi.Escape not in captured.out
+
+
 def test_dump_predefined_color_styles(capsys):
     """Validate :func:`~ci_exec.colorize.dump_predefined_color_styles` dumps all."""
     dump_predefined_color_styles()
@@ -269,3 +287,17 @@ def test_log_stage(capsys, stage: str, fill_char_: Optional[str], pad_: Optional
     assert captured.out == ""
     verify_all(captured.err)
     assert captured.err == orig_out.replace("\n", "")
+
+
+def test_log_stage_print_kwargs(capsys):
+    """Validate |log_stage| ``**kwargs`` behave the same as :func:`python:print`."""
+    log_stage("CMake.Build", width=20, color=None, end="!", flush=True)
+    captured = capsys.readouterr()
+    assert captured.out == "=== CMake.Build ====!"
+
+    with pytest.raises(TypeError):
+        log_stage("CMake.Build", not_a_print_kwarg=True)
+    with pytest.raises(TypeError):
+        log_stage("CMake.Build", sep=5)
+    with pytest.raises(TypeError):
+        log_stage("CMake.Build", end=5)
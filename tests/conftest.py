@@ -0,0 +1,36 @@
+########################################################################################
+# Copyright 2019-2021 Stephen McDowell                                                 #
+#                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                      #
+# you may not use this file except in compliance with the License.                     #
+# You may obtain a copy of the License at                                              #
+#                                                                                      #
+#     http://www.apache.org/licenses/LICENSE-2.0                                       #
+#                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.             #
+# See the License for the specific language governing permissions and                  #
+# limitations under the License.                                                       #
+########################################################################################
+"""Shared pytest configuration for the ``ci_exec`` tests."""
+
+import importlib
+
+import ci_exec.core
+from ci_exec.colorize import Colors, Styles, colorize
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def colors_enabled(monkeypatch):
+    """Ignore ``NO_COLOR`` from the environment running the tests, colors are tested."""
+    # NOTE: ci_exec.colorize is the function, not the module.
+    colorize_module = importlib.import_module("ci_exec.colorize")
+    monkeypatch.setattr(colorize_module, "_no_color", False)
+    # The fail() prefix is colorized once on import, before this fixture runs.
+    monkeypatch.setattr(
+        ci_exec.core, "_fail_prefix",
+        colorize("[X] ", color=Colors.Red, style=Styles.Bold)
+    )
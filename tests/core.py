@@ -16,19 +16,30 @@
 """Tests for the :mod:`ci_exec.core` module."""
 
 import itertools
+import os
 import platform
 import re
+import shlex
 import shutil
+import subprocess
 import sys
 from pathlib import Path
 from subprocess import PIPE
 
 from ci_exec.colorize import Ansi, Colors, Styles, colorize
-from ci_exec.core import Executable, fail, mkdir_p, rm_rf, which
+from ci_exec.core import Executable, fail, mkdir_p, pipeline, rm_rf, which, which_many
+from ci_exec.utils import cd, set_env
 
 import pytest
 
 
+def join_args(popen_args: tuple) -> str:
+    """Return how |Executable| logs ``popen_args`` on the current platform."""
+    if platform.system() == "Windows":
+        return subprocess.list2cmdline(popen_args)
+    return " ".join(shlex.quote(arg) for arg in popen_args)
+
+
 @pytest.mark.parametrize(
     "why,exit_code,no_prefix",
     [
@@ -115,7 +126,7 @@ def test_executable_logging(capsys):
         print(proc.stdout.decode("utf-8"), end="")
         if exe.log_calls:
             popen_args = (exe.exe_path, *args)
-            message = f"{exe.log_prefix}{' '.join(popen_args)}"
+            message = f"{exe.log_prefix}{join_args(popen_args)}"
             if exe.log_color:
                 message = colorize(message, color=exe.log_color, style=exe.log_style)
             return message
@@ -202,6 +213,15 @@ def test_executable_failures(capsys):
     assert b"unrecognized argument" in proc.stderr
     assert b"--petty=%B" in proc.stderr
 
+    # Processes killed by a signal have a negative returncode, fail with 1 instead.
+    if platform.system() != "Windows":
+        python = Executable(sys.executable, log_calls=False)
+        with pytest.raises(SystemExit) as se_excinfo:
+            python("-c", "import os, signal; os.kill(os.getpid(), signal.SIGKILL)")
+        assert se_excinfo.value.code == 1
+        captured = capsys.readouterr()
+        assert "died with" in captured.err
+
     # Clear capsys before this test.
     captured = capsys.readouterr()
 
@@ -215,6 +235,213 @@ def test_executable_failures(capsys):
     assert "unexpected keyword argument 'not_valid_subprocess_kwarg'" in captured.err
 
 
+def test_executable_cached(capsys):
+    """Validate |Executable| ``cached=True`` reuses successful results."""
+    cache_dir = Path(".").resolve() / "ci_exec_test_cache"
+    rm_rf(cache_dir)
+    python = Executable(sys.executable, log_calls=False)
+    now = ("-c", "import time; print(time.time())")
+    pipe = {"stdout": PIPE, "stderr": PIPE}
+
+    with set_env(CI_EXEC_CACHE_DIR=str(cache_dir)):
+        first = python(*now, cached=True, **pipe)
+        assert first.returncode == 0
+        assert python(*now, cached=True, **pipe).stdout == first.stdout
+
+        # Without cached=True, different kwargs, or CI_EXEC_NO_CACHE=1 runs again.
+        assert python(*now, **pipe).stdout != first.stdout
+        assert python(*now, cached=True, env={"A": "B"}, **pipe).stdout != first.stdout
+        with set_env(CI_EXEC_NO_CACHE="1"):
+            assert python(*now, cached=True, **pipe).stdout != first.stdout
+
+        # Failures are not cached.
+        fail_now = ("-c", "import sys, time; print(time.time()); sys.exit(1)")
+        failed = python(*fail_now, cached=True, check=False, **pipe)
+        assert failed.returncode == 1
+        assert python(*fail_now, cached=True, check=False, **pipe).stdout != \
+            failed.stdout
+        with pytest.raises(SystemExit):
+            python(*fail_now, cached=True, **pipe)
+        assert "returned non-zero exit status 1" in capsys.readouterr().err
+
+        # Text output round trips as str, bytes output as bytes.
+        text = python(*now, cached=True, universal_newlines=True, **pipe)
+        assert isinstance(text.stdout, str)
+        assert python(*now, cached=True, universal_newlines=True, **pipe).stdout == \
+            text.stdout
+        assert isinstance(first.stdout, bytes)
+
+        # Cache files are plain data, anything else is ignored and the command reruns.
+        cache_files = list(cache_dir.iterdir())
+        assert cache_files
+        for cache_file in cache_files:
+            assert cache_file.suffix == ".json"
+            cache_file.write_text("not json!")
+        assert python(*now, cached=True, **pipe).stdout != first.stdout
+
+        # Changing the executable invalidates its cached results.
+        if platform.system() != "Windows":
+            script = Path(".").resolve() / "ci_exec_test_cached.sh"
+            script.write_text("#!/bin/sh\necho one\n")
+            script.chmod(0o755)
+            assert Executable(str(script), log_calls=False)(
+                cached=True, **pipe
+            ).stdout == b"one\n"
+            script.write_text("#!/bin/sh\necho three\n")
+            assert Executable(str(script), log_calls=False)(
+                cached=True, **pipe
+            ).stdout == b"three\n"
+            rm_rf(script)
+
+    rm_rf(cache_dir)
+
+
+def test_executable_stream(capsys):
+    """Validate :func:`Executable.stream <ci_exec.core.Executable.stream>`."""
+    python = Executable(sys.executable, log_calls=False)
+    count = (
+        "-c", "import sys\nfor i in range(3): print(i); print(-i, file=sys.stderr)"
+    )
+
+    # Default: stdout and stderr are written to sys.stdout.
+    proc = python.stream(*count)
+    assert proc.returncode == 0
+    assert proc.stdout is None
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert sorted(int(line) for line in captured.out.splitlines()) == \
+        [-2, -1, 0, 0, 1, 2]
+
+    # Custom line handling, stderr can be separated.
+    lines = []
+    python.stream(*count, on_line=lines.append, stderr=PIPE)
+    assert lines == ["0\n", "1\n", "2\n"]
+
+    # Failures mirror the exit code, unless check=False.
+    fail_7 = ("-c", "import sys; print('bye'); sys.exit(7)")
+    with pytest.raises(SystemExit) as se_excinfo:
+        python.stream(*fail_7)
+    assert se_excinfo.value.code == 7
+    captured = capsys.readouterr()
+    assert captured.out == "bye\n"
+    assert "returned non-zero exit status 7" in captured.err
+    assert python.stream(*fail_7, check=False).returncode == 7
+    capsys.readouterr()
+
+    # Exceptions in on_line stop the process.
+    def on_line(line: str):
+        raise RuntimeError("stop")
+
+    with pytest.raises(RuntimeError, match="stop"):
+        python.stream(*count, on_line=on_line)
+
+    # Invalid arguments to subprocess.Popen fail.
+    with pytest.raises(SystemExit) as se_excinfo:
+        python.stream(*count, not_valid_popen_kwarg=True)
+    assert se_excinfo.value.code == 1
+    captured = capsys.readouterr()
+    assert "Executable.stream: invalid kwarg(s) for subprocess.Popen" in captured.err
+    assert "unexpected keyword argument 'not_valid_popen_kwarg'" in captured.err
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_executable_map(capsys, mode: str):
+    """Validate :func:`Executable.map <ci_exec.core.Executable.map>` runs everything."""
+    python = Executable(sys.executable)
+    pipe = {"stdout": PIPE, "stderr": PIPE}
+    args_list = [("-c", f"print({i})") for i in range(8)]
+    procs = python.map(args_list, workers=4, mode=mode, **pipe)
+    assert [proc.stdout.decode("utf-8").strip() for proc in procs] == \
+        [f"{i}" for i in range(8)]
+
+    # Every invocation is logged (in order) up front.
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    for args, line in zip(args_list, captured.out.splitlines()):
+        assert line == colorize(
+            f"$ {join_args((sys.executable, *args))}", color=Colors.Cyan,
+            style=Styles.Bold
+        )
+    if platform.system() != "Windows":
+        assert f"$ {sys.executable} -c 'print(0)'" in captured.out
+
+    # The first failure fails (with mirrored exit code) after everything has run.
+    python.log_calls = False
+    exit_codes = (0, 3, 4)
+    with pytest.raises(SystemExit) as se_excinfo:
+        python.map(
+            [("-c", f"import sys; sys.exit({code})") for code in exit_codes], mode=mode
+        )
+    assert se_excinfo.value.code == 3
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "returned non-zero exit status 3" in captured.err
+
+    # check=False is forwarded.
+    procs = python.map(
+        [("-c", f"import sys; sys.exit({code})") for code in exit_codes], mode=mode,
+        check=False
+    )
+    assert tuple(proc.returncode for proc in procs) == exit_codes
+
+    # Invalid arguments to subprocess.run fail.
+    with pytest.raises(SystemExit) as se_excinfo:
+        python.map(args_list, mode=mode, not_valid_run_kwarg=True)
+    assert se_excinfo.value.code == 1
+    captured = capsys.readouterr()
+    assert "Executable.map: invalid kwarg(s) for subprocess.run" in captured.err
+    assert "unexpected keyword argument 'not_valid_run_kwarg'" in captured.err
+
+    with pytest.raises(ValueError, match="invalid mode 'fiber'"):
+        python.map(args_list, mode="fiber")
+
+
+def test_pipeline(capsys):
+    """Validate |pipeline| connects stages and fails as expected."""
+    python = Executable(sys.executable, log_calls=False)
+    count = ["-c", "for i in range(1000): print(i)"]
+    double = ["-c", "import sys\nfor line in sys.stdin: print(int(line) * 2)"]
+    fail_3 = ["-c", "import sys; sys.stdin.read(); sys.exit(3)"]
+
+    with pipeline((python, count), (python, double)) as lines:
+        assert [int(line) for line in lines] == [i * 2 for i in range(1000)]
+
+    # Single stage is allowed, stages are logged when launched.
+    python.log_calls = True
+    with pipeline((python, count)) as lines:
+        assert len(list(lines)) == 1000
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert f"$ {sys.executable} -c" in captured.out
+    python.log_calls = False
+
+    # Non-zero exit codes fail (mirroring the exit code) after all stages are done.
+    with pytest.raises(SystemExit) as se_excinfo:
+        with pipeline((python, count), (python, fail_3), (python, double)) as lines:
+            assert list(lines) == []
+    assert se_excinfo.value.code == 3
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "returned non-zero exit status 3" in captured.err
+
+    # Stopping early with check=False is ok.
+    with pipeline((python, count), (python, double), check=False) as lines:
+        assert int(next(lines)) == 0
+
+    # Invalid arguments to subprocess.Popen fail.
+    with pytest.raises(SystemExit) as se_excinfo:
+        with pipeline((python, count), not_valid_popen_kwarg=True):
+            pass  # pragma: no cover
+    assert se_excinfo.value.code == 1
+    captured = capsys.readouterr()
+    assert "pipeline: invalid kwarg(s) for subprocess.Popen" in captured.err
+    assert "unexpected keyword argument 'not_valid_popen_kwarg'" in captured.err
+
+    with pytest.raises(ValueError, match="at least one stage required"):
+        with pipeline():
+            pass  # pragma: no cover
+
+
 def test_mkdir_p(capsys):
     """Validate that |mkdir_p| creates directories as expected."""
     # Relative paths should be ok.
@@ -233,6 +460,15 @@ def test_mkdir_p(capsys):
     mkdir_p("hello")
     assert hello.is_dir()
 
+    # Without parents, existing directories are ok only with exist_ok.
+    mkdir_p(hello, parents=False)
+    with pytest.raises(SystemExit):
+        mkdir_p(hello, parents=False, exist_ok=False)
+    assert "Unable to mkdir_p" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        mkdir_p(hello / "no" / "parents", parents=False)
+    assert "Unable to mkdir_p" in capsys.readouterr().err
+
     # Long chains should be allowed.
     hello_there = hello / "there"
     hello_there_beautiful = hello_there / "beautiful"
@@ -379,7 +615,7 @@ def test_rm_rf(capsys):
     rm_rf("hi")
 
 
-def test_which(capsys):
+def test_which(capsys, monkeypatch):
     """Validate that |which| finds or does not find executables."""
     # Make sure ci_exec.core.which and shutil.which agree (how could then not? xD).
     git = which("git")
@@ -412,7 +648,78 @@ def test_which(capsys):
     assert proc.stderr == b""
     assert proc.stdout.decode("utf-8").strip() == f"{sys.version_info}"
 
+    # Found commands are cached, unless $PATH changes.
+    def no_which(*args, **kwargs):
+        raise RuntimeError("should not be called")  # pragma: no cover
+
+    with monkeypatch.context() as mp:
+        mp.setattr(shutil, "which", no_which)
+        assert which("git").exe_path == git_path
+    with set_env(PATH=str(Path(".").resolve() / "not_a_directory")):
+        with pytest.raises(SystemExit):
+            which("git")
+    captured = capsys.readouterr()
+    assert "Could not find 'git' in $PATH." in captured.err
+
+    # Relative $PATH entries are not cached, and a cached path that is removed is
+    # searched for again.
+    if platform.system() != "Windows":
+        root = Path(".").resolve() / "which_root"
+        rm_rf(root)
+        mkdir_p(root / "a" / "bin")
+        mkdir_p(root / "b")
+        tool = root / "a" / "bin" / "tool"
+        tool.write_text("#!/bin/sh\n")
+        tool.chmod(0o755)
+        with set_env(PATH="bin"):
+            with cd(root / "a"):
+                assert which("tool").exe_path == str(tool)
+            with cd(root / "b"):
+                with pytest.raises(SystemExit):
+                    which("tool")
+        captured = capsys.readouterr()
+        assert "Could not find 'tool' in $PATH." in captured.err
+
+        tool_dir = str(tool.parent)
+        assert which("tool", path=tool_dir).exe_path == str(tool)
+        rm_rf(tool)
+        with pytest.raises(SystemExit):
+            which("tool", path=tool_dir)
+        captured = capsys.readouterr()
+        assert "Could not find 'tool' in $PATH." in captured.err
+        rm_rf(root)
+
     # :)
     with pytest.raises(TypeError) as te_excinfo:
         which("git", log_callz=False)
     assert "unexpected keyword argument 'log_callz'" in str(te_excinfo.value)
+
+
+def test_which_many(capsys):
+    """Validate that :func:`~ci_exec.core.which_many` agrees with |which|."""
+    actual_python = Path(sys.executable)
+    python_name = actual_python.name
+    python_dir = str(actual_python.parent)
+    # Include a directory that does not exist and a repeated command.
+    search = f"{Path('.').resolve() / 'not_a_directory'}{os.pathsep}{python_dir}"
+    tools = which_many([python_name, python_name], path=search, log_calls=False)
+    assert list(tools) == [python_name]
+    assert tools[python_name].exe_path == str(actual_python)
+    assert not tools[python_name].log_calls
+
+    # Searching $PATH finds the same commands as shutil.which.
+    tools = which_many(["git", python_name])
+    assert tools["git"].exe_path == shutil.which("git")
+    assert tools[python_name].exe_path == shutil.which(python_name)
+
+    # All missing commands are reported.
+    no_cmd_1 = "ja" * 22
+    no_cmd_2 = "ha" * 22
+    with pytest.raises(SystemExit) as se_excinfo:
+        which_many([no_cmd_1, "git", no_cmd_2])
+    assert se_excinfo.value.code == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    prefix = colorize("[X] ", color=Colors.Red, style=Styles.Bold)
+    missing = f"'{no_cmd_1}', '{no_cmd_2}'"
+    assert captured.err == f"{prefix}Could not find {missing} in $PATH.\n"
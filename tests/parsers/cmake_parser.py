@@ -15,6 +15,7 @@
 ########################################################################################
 """Tests for the :mod:`ci_exec.parsers.cmake_parser` module."""
 
+import argparse
 from itertools import chain
 from typing import Tuple
 
@@ -58,6 +59,14 @@ def test_cmake_parser_is_x_config_generator():
         assert not CMakeParser.is_single_config_generator(g)
         assert CMakeParser.is_multi_config_generator(g)
 
+    # The -G choices are every generator, sorted.
+    all_generators = sorted(chain(
+        CMakeParser.makefile_generators, CMakeParser.ninja_generator,
+        CMakeParser.visual_studio_generators, CMakeParser.other_generators,
+        CMakeParser.ninja_multi_generator
+    ))
+    assert list(CMakeParser().get_argument("-G").choices) == all_generators
+
 
 @unset_env("CC", "CXX")
 def test_cmake_parser_defaults():
@@ -114,6 +123,24 @@ def test_cmake_parser_add_argument_failues():
     parser.add_argument("extra_args")  # OK
 
 
+@unset_env("CC", "CXX")
+def test_cmake_parser_help():
+    """Validate the |CMakeParser| help includes non-``None`` defaults only."""
+    parser = CMakeParser()
+    parser.add_argument("--opt", type=str, default=None, help="An option.")
+    parser.add_argument("--num", type=int, default=3, help="A number.")
+    help_text = " ".join(parser.format_help().split())  # normalize wrapping
+    assert "(default: None)" not in help_text
+    assert "An option." in help_text
+    assert "A number. (default: 3)" in help_text
+    assert "(default: Ninja)" in help_text
+    assert "(default: Release)" in help_text
+
+    # User supplied formatter_class is used as is.
+    parser = CMakeParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    assert "(default: None)" in " ".join(parser.format_help().split())
+
+
 @unset_env("CC", "CXX")
 def test_cmake_parser_get_argument():
     """
@@ -160,9 +187,44 @@ def test_cmake_parser_get_argument():
 
     assert parser.get_argument("positional").nargs == 1
 
+    group = parser.add_argument_group("grouped")
+    group.add_argument("--in-group", dest="in_group", type=int, default=7)
+    assert parser.get_argument("--in-group").default == 7
+    assert parser.get_argument("in_group").default == 7
+
     # None should be returned when argument not found.
     assert parser.get_argument("--not-here") is None
 
+    # Including arguments that were removed.
+    parser.remove("--shared", "toolset")
+    for arg in ("--shared", "shared", "-T", "toolset"):
+        assert parser.get_argument(arg) is None
+
+    # Flags taken over with conflict_handler="resolve" find the new action.
+    parser = CMakeParser(conflict_handler="resolve")
+    parser.add_argument("--foo", dest="a")
+    parser.add_argument("--foo", dest="b")
+    assert parser.get_argument("--foo").dest == "b"
+    assert parser.get_argument("b").dest == "b"
+    assert parser.get_argument("a") is None
+
+    parser.add_argument("-x", "--ex", dest="c")
+    parser.add_argument("--ex", dest="d")
+    assert parser.get_argument("--ex").dest == "d"
+    assert parser.get_argument("-x").dest == "c"
+    assert parser.get_argument("c").dest == "c"
+    parser.add_argument("--ex", dest="e")
+    assert parser.get_argument("--ex").dest == "e"
+    assert parser.get_argument("d") is None
+
+    # The first action added for a dest is found, even when it is in a group.
+    parser = CMakeParser()
+    group = parser.add_argument_group("g")
+    group.add_argument("--foo", dest="z")
+    parser.add_argument("--bar", dest="z")
+    assert parser.get_argument("z").option_strings == ["--foo"]
+    assert parser.get_argument("--bar").option_strings == ["--bar"]
+
 
 @unset_env("CC", "CXX")
 def test_cmake_parser_remove():
@@ -195,8 +257,14 @@ def test_cmake_parser_remove():
     assert str(ve_excinfo.value) == "Cannot remove unregistered arg(s): ['foo']"
 
     with pytest.raises(ValueError) as ve_excinfo:
-        parser.remove("foo", "shared", "bar")  # removes shared (!)
+        parser.remove("foo", "shared", "bar")  # does not remove shared
     assert str(ve_excinfo.value) == "Cannot remove unregistered arg(s): ['foo', 'bar']"
+    assert parser.get_argument("shared") is parser.flag_map["--shared"]
+
+    # The same argument may be listed by both flag and dest.
+    parser.remove("--shared", "shared")
+    assert "--shared" not in parser.flag_map
+    assert "shared" not in parser.dest_map
 
     # Test removing items and make sure parse_args doesn't include them.
     flag_to_dest = {
@@ -338,6 +406,11 @@ def test_cmake_parser_set_argument():
     assert build_type.default == "Debug"
     assert set(build_type.choices) == {"Release", "Debug"}
 
+    # Build types other than the default choices are still passed along.
+    parser.set_argument("build_type", choices={"Release", "Coverage"})
+    args = parser.parse_args(["--build-type", "Coverage"])
+    assert "-DCMAKE_BUILD_TYPE=Coverage" in args.cmake_configure_args
+
 
 @unset_env("CC", "CXX")
 def test_cmake_parser_extra_args():
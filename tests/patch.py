@@ -21,7 +21,7 @@ from typing import Tuple
 
 from ci_exec.colorize import Colors, Styles, colorize
 from ci_exec.core import mkdir_p, rm_rf
-from ci_exec.patch import filter_file, unified_diff
+from ci_exec.patch import _pygments_diff, filter_file, unified_diff
 
 import pytest
 
@@ -111,6 +111,20 @@ def test_filter_file(capsys):
         assert bku == _please_stop
         assert cml == _please_stop.replace("super_project", "SUPER_PROJECT")
 
+        # Replacements using group references.
+        filter_town, cmake_lists_txt = _make_dummy()
+        backup = filter_file(
+            cmake_lists_txt, "super_project", r"<\g<0>>", line_based=line_based
+        )
+        cml, bku = read_both(cmake_lists_txt, backup)
+        assert cml == _please_stop.replace("super_project", "<super_project>")
+
+    # Plain text patterns respect count.
+    filter_town, cmake_lists_txt = _make_dummy()
+    backup = filter_file(cmake_lists_txt, "super_project", "SUPER_PROJECT", count=1)
+    cml, bku = read_both(cmake_lists_txt, backup)
+    assert cml == _please_stop.replace("super_project", "SUPER_PROJECT", 1)
+
     # Cleanup
     rm_rf(filter_town)
 
@@ -175,10 +189,12 @@ def test_unified_diff(capsys):
             fmt = formatters.get_formatter_by_name("console")
             assert diff == pygments.highlight(expected_diff, lex(), fmt)
 
-    # Force in an error just for shiggles (and because we can).
+    # Force in an error just for shiggles (and because we can).  The lexer / formatter
+    # lookup is cached, clear it so that the failing lookup is used.
     def superfail(*args, **kwargs):
         raise ValueError("superfail")
     lexers.find_lexer_class_by_name = superfail
+    _pygments_diff.cache_clear()
 
     # Attempt to call pygments code now that this raises.  Result: original text.
     diff, expected_diff = filter_diff(False)
@@ -56,6 +56,12 @@ def test_provider_is_ci():
         with set_env(**generic_map):
             assert Provider.is_ci()
 
+    # The generic providers are case insensitive.
+    for generic in _generic_providers:
+        generic_map = {generic: "TRUE"}
+        with set_env(**generic_map):
+            assert Provider.is_ci()
+
     # Test both being set report success.
     full_generic_map = {generic: "true" for generic in _generic_providers}
     with set_env(**full_generic_map):
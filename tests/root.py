@@ -0,0 +1,81 @@
+########################################################################################
+# Copyright 2019-2021 Stephen McDowell                                                 #
+#                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                      #
+# you may not use this file except in compliance with the License.                     #
+# You may obtain a copy of the License at                                              #
+#                                                                                      #
+#     http://www.apache.org/licenses/LICENSE-2.0                                       #
+#                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.             #
+# See the License for the specific language governing permissions and                  #
+# limitations under the License.                                                       #
+########################################################################################
+"""Tests for the :mod:`ci_exec` top-level namespace."""
+
+import os
+import subprocess
+import sys
+
+import ci_exec
+
+import pytest
+
+
+def test_all_top_level():
+    """Validate every name in ``ci_exec.__all__`` can be accessed and is in ``dir``."""
+    top_level_dir = dir(ci_exec)
+    for name in ci_exec.__all__:
+        assert getattr(ci_exec, name).__name__ == name
+        assert name in top_level_dir
+
+    # The colorize submodule may not shadow the colorize function.
+    assert callable(ci_exec.colorize)
+
+    with pytest.raises(AttributeError, match="has no attribute 'not_a_thing'"):
+        ci_exec.not_a_thing
+
+
+@pytest.mark.parametrize("eager", ["0", "1"])
+def test_lazy_imports(eager: str):
+    """Validate submodules are only imported on demand unless CI_EXEC_EAGER_IMPORT=1."""
+    code = (
+        "import sys; import ci_exec; "
+        "print(' '.join(sorted(m for m in sys.modules if m.startswith('ci_exec'))))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], env={**os.environ, "CI_EXEC_EAGER_IMPORT": eager},
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True,
+        check=True
+    )
+    loaded = set(proc.stdout.split())
+    lazy = {"ci_exec.core", "ci_exec.parsers", "ci_exec.patch", "ci_exec.provider",
+            "ci_exec.utils"}
+    if eager == "1" or sys.version_info < (3, 7):
+        assert lazy <= loaded
+    else:
+        assert loaded == {"ci_exec", "ci_exec.colorize"}
+
+
+def test_submodules():
+    """Validate ``ci_exec.core`` etc are accessible without importing them first."""
+    code = (
+        "import ci_exec; "
+        "ci_exec.core.which; ci_exec.parsers.CMakeParser; ci_exec.patch.filter_file; "
+        "ci_exec.provider.Provider; ci_exec.utils.cd; "
+        "print(' '.join(dir(ci_exec)))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True
+    )
+    top_level_dir = set(proc.stdout.split())
+    assert {"core", "parsers", "patch", "provider", "utils"} <= top_level_dir
+
+    # Modules used to implement the lazy imports are not part of the namespace.
+    for name in ("importlib", "os", "sys", "TYPE_CHECKING"):
+        assert name not in top_level_dir
+        with pytest.raises(AttributeError):
+            getattr(ci_exec, name)
@@ -174,8 +174,8 @@ def test_cd(capsys):
     second = first / "second"
     third = second / "third"
 
-    path_cwd = Path.cwd
-    Path.cwd = uh_uh_uh
+    os_getcwd = os.getcwd
+    os.getcwd = uh_uh_uh
     with pytest.raises(SystemExit):
         with cd(third, create=True):
             pass  # pragma: nocover
@@ -184,7 +184,7 @@ def test_cd(capsys):
     assert captured.err.strip().endswith(
         "cd: could not get current working directory: You didn't say the magic word!"
     )
-    Path.cwd = path_cwd
+    os.getcwd = os_getcwd
     assert str(Path.cwd()) == starting_cwd
 
     # Test second failure case in cd.__enter__ where os.chdir does not succeed.
@@ -376,6 +376,26 @@ def test_set_env():
     kwargs = {"z": -3, "w": 111}
     assert func_returns(*args, **kwargs) == False  # noqa: E712
 
+    # Variables set to the empty string are restored, not deleted.
+    with set_env(CC=""):
+        with set_env(CC="clang"):
+            assert os.environ["CC"] == "clang"
+        assert os.environ["CC"] == ""
+    assert "CC" not in os.environ
+
+    # Decorated functions called repeatedly must not reuse state from earlier calls.
+    @set_env(CC="clang")
+    def set_cc_again():
+        assert os.environ["CC"] == "clang"
+
+    set_cc_again()
+    assert "CC" not in os.environ
+    with set_env(CC="gcc"):
+        set_cc_again()
+        assert os.environ["CC"] == "gcc"
+    set_cc_again()
+    assert "CC" not in os.environ
+
 
 def test_unset_env():
     """Validate |unset_env| unsets environment variables."""
@@ -515,3 +535,21 @@ def test_unset_env():
     args = [1, 2]
     kwargs = {"z": -3, "w": 111}
     assert func_returns_wrapper(*args, **kwargs) == False  # noqa: E712
+
+    # Variables set to the empty string are unset, and restored.
+    with set_env(CC=""):
+        with unset_env("CC"):
+            assert "CC" not in os.environ
+        assert os.environ["CC"] == ""
+    assert "CC" not in os.environ
+
+    # Decorated functions called repeatedly must not reuse state from earlier calls.
+    @unset_env("CC")
+    def unset_cc_again():
+        assert "CC" not in os.environ
+
+    with set_env(CC="clang"):
+        unset_cc_again()
+        assert os.environ["CC"] == "clang"
+    unset_cc_again()
+    assert "CC" not in os.environ